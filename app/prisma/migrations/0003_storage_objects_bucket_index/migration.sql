@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "idx_storage_objects_bucket_created" ON "storage_objects"("bucket", "created_at");
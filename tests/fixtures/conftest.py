@@ -7,27 +7,157 @@ Provides:
 - UTC timezone pinning
 """
 
+import collections
+import functools
+import io
 import json
 import os
+import pathlib
 import tempfile
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
 
 import pytest
 
-FIXTURES_DIR = os.path.dirname(os.path.abspath(__file__))
-GOLDEN_SSOT_PATH = os.path.join(FIXTURES_DIR, "golden-ssot.json")
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
 
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+FIXTURES_DIR = str(ROOT / "tests" / "fixtures")
+GOLDEN_SSOT_PATH = str(ROOT / "tests" / "fixtures" / "golden-ssot.json")
 
-@pytest.fixture(autouse=True)
-def _pin_utc(monkeypatch):
-    """Pin timezone to UTC for deterministic tests."""
-    monkeypatch.setenv("TZ", "UTC")
+
+def pytest_configure(config):
+    """Pin timezone to UTC once for the whole session."""
+    os.environ["TZ"] = "UTC"
+    time.tzset()
+
+
+@functools.lru_cache(maxsize=None)
+def load_golden_ssot() -> dict:
+    """Parse the golden SSOT once per process. Callers must not mutate it."""
+    raw = pathlib.Path(GOLDEN_SSOT_PATH).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def clone_json(obj):
+    """Deep copy JSON-shaped data with a dump/load round trip."""
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(obj))
+    return json.loads(json.dumps(obj))
+
+
+def ssot_with_overrides(ssot: Mapping, **overrides) -> dict:
+    """Return a shallow copy of ``ssot`` with ``overrides`` applied.
+
+    Dict overrides are merged into the existing subtree; any other value
+    replaces it. Subtrees that are not overridden stay shared with ``ssot``,
+    so treat them as read-only.
+    """
+    merged = dict(ssot)
+    for key, value in overrides.items():
+        current = merged.get(key)
+        if isinstance(value, dict) and isinstance(current, Mapping):
+            value = ssot_with_overrides(current, **value)
+        merged[key] = value
+    return merged
+
+
+def pdf_full_text(path: str) -> str:
+    """Extract the text of every page of the PDF at ``path`` in one pass."""
+    import fitz
+
+    with fitz.open(path) as doc:
+        return "\n".join(page.get_text("text") for page in doc)
+
+
+def pdf_cover_text(path: str) -> str:
+    """Extract the text of the first page of the PDF at ``path``."""
+    import fitz
+
+    with fitz.open(path) as doc:
+        return doc[0].get_text("text")
+
+
+def freeze(node):
+    """Recursively wrap dicts in MappingProxyType and turn lists into tuples."""
+    if isinstance(node, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in node.items()})
+    if isinstance(node, list):
+        return tuple(freeze(v) for v in node)
+    return node
+
+
+def _shallow_copy(node):
+    return dict(node) if isinstance(node, Mapping) else list(node)
+
+
+def patched(ssot: Mapping, *mutations) -> dict:
+    """Return a copy of ``ssot`` with ``mutations`` applied copy-on-write.
+
+    Each mutation is ``(dotted_path, value)``, e.g. ``("pricing.subtotal", 0)``
+    or ``("items.0.dimensions.width.value", 5)``; numeric segments index
+    lists and a trailing ``+`` appends (``("items.+", item)``). A callable
+    value is applied to the current leaf (``("pricing.subtotal", lambda v:
+    v + 500)``). Only the containers along each path are copied, everything
+    else is shared with ``ssot`` and must be treated as read-only.
+    """
+    root = _shallow_copy(ssot)
+    for path, value in mutations:
+        keys = [int(k) if k.isdigit() else k for k in path.split(".")]
+        node = root
+        for key in keys[:-1]:
+            node[key] = _shallow_copy(node[key])
+            node = node[key]
+        leaf = keys[-1]
+        if leaf == "+":
+            node.append(value)
+        elif callable(value):
+            node[leaf] = value(node[leaf])
+        else:
+            node[leaf] = value
+    return root
+
+
+def by_code(errors) -> collections.defaultdict:
+    """Bucket validation errors by ``code`` in a single pass."""
+    buckets = collections.defaultdict(list)
+    for e in errors:
+        buckets[e.code].append(e)
+    return buckets
+
+
+def by_code_item(errors) -> collections.defaultdict:
+    """Bucket validation errors by ``(code, item_id)`` in a single pass."""
+    buckets = collections.defaultdict(list)
+    for e in errors:
+        buckets[e.code, e.item_id].append(e)
+    return buckets
+
+
+def ids_by_code(errors) -> collections.defaultdict:
+    """Map each error ``code`` to the set of item ids it was raised for."""
+    ids = collections.defaultdict(set)
+    for e in errors:
+        ids[e.code].add(e.item_id)
+    return ids
+
+
+@pytest.fixture(scope="session")
+def golden_ssot() -> MappingProxyType:
+    """Deeply frozen golden SSOT, shared across the session."""
+    return freeze(load_golden_ssot())
 
 
 @pytest.fixture
-def golden_ssot() -> dict:
-    """Load the golden SSOT fixture."""
-    with open(GOLDEN_SSOT_PATH) as f:
-        return json.load(f)
+def golden_ssot_mut() -> dict:
+    """Private deep copy of the golden SSOT for tests that mutate it."""
+    return clone_json(load_golden_ssot())
 
 
 @pytest.fixture
@@ -36,34 +166,22 @@ def golden_ssot_path() -> str:
     return GOLDEN_SSOT_PATH
 
 
+@pytest.fixture(scope="session")
+def tmp_output_dir(tmp_path_factory):
+    """Session-wide output directory; tests must use distinct filenames."""
+    return str(tmp_path_factory.mktemp("output"))
+
+
 @pytest.fixture
-def tmp_output_dir(tmp_path):
-    """Provide a temporary output directory for generated files."""
+def tmp_output_dir_iso(tmp_path):
+    """Per-test output directory for tests that need an empty dir."""
     out = tmp_path / "output"
     out.mkdir()
     return str(out)
 
 
-@pytest.fixture
-def synthetic_pdf_path(tmp_path) -> str:
-    """Generate a small synthetic multi-page PDF for testing.
-
-    Pages:
-      0: Title page with 'GLASS BID SET', 'cover sheet'
-      1: Floor plan with 'shower', 'master bath', 'floor plan'
-      2: Schedule with dimension callouts '36" x 78"' and 'SHOWER ENCLOSURE'
-      3: Notes page with 'ASSUMPTIONS:' and 'EXCLUSIONS:' sections
-      4: Detail page with 'shower detail', '1/2 low iron'
-      5: Irrelevant filler page
-    """
-    from reportlab.lib.pagesizes import letter
-    from reportlab.pdfgen.canvas import Canvas
-
-    pdf_path = str(tmp_path / "synthetic-test.pdf")
-    c = Canvas(pdf_path, pagesize=letter)
-    W, H = letter
-
-    # Page 0: Title / Cover Sheet
+def _draw_cover(c, W, H):
+    """Title page with 'GLASS BID SET', 'cover sheet'."""
     c.setFont("Helvetica-Bold", 24)
     c.drawCentredString(W / 2, H - 200, "GLASS BID SET")
     c.setFont("Helvetica", 14)
@@ -72,7 +190,9 @@ def synthetic_pdf_path(tmp_path) -> str:
     c.drawCentredString(W / 2, H - 300, "Sheet Index")
     c.showPage()
 
-    # Page 1: Floor Plan
+
+def _draw_floor_plan(c, W, H):
+    """Floor plan with 'shower', 'master bath', 'floor plan'."""
     c.setFont("Helvetica-Bold", 18)
     c.drawString(72, H - 72, "FLOOR PLAN - LEVEL 3")
     c.setFont("Helvetica", 11)
@@ -82,7 +202,9 @@ def synthetic_pdf_path(tmp_path) -> str:
     c.drawString(72, H - 195, "Reflected ceiling plan view")
     c.showPage()
 
-    # Page 2: Schedule
+
+def _draw_schedule(c, W, H):
+    """Schedule with dimension callouts '36" x 78"' and 'SHOWER ENCLOSURE'."""
     c.setFont("Helvetica-Bold", 18)
     c.drawString(72, H - 72, "GLASS & MIRROR SCHEDULE")
     c.setFont("Helvetica", 10)
@@ -101,7 +223,9 @@ def synthetic_pdf_path(tmp_path) -> str:
         y -= 18
     c.showPage()
 
-    # Page 3: Notes
+
+def _draw_notes(c, W, H):
+    """Notes page with 'ASSUMPTIONS:' and 'EXCLUSIONS:' sections."""
     c.setFont("Helvetica-Bold", 18)
     c.drawString(72, H - 72, "GENERAL NOTES")
     c.setFont("Helvetica", 10)
@@ -127,7 +251,9 @@ def synthetic_pdf_path(tmp_path) -> str:
         y -= 16
     c.showPage()
 
-    # Page 4: Detail
+
+def _draw_detail(c, W, H):
+    """Detail page with 'shower detail', '1/2 low iron'."""
     c.setFont("Helvetica-Bold", 18)
     c.drawString(72, H - 72, "SHOWER DETAIL - SD-5")
     c.setFont("Helvetica", 10)
@@ -137,12 +263,72 @@ def synthetic_pdf_path(tmp_path) -> str:
     c.drawString(72, H - 180, "Enlarged view of hinge connection")
     c.showPage()
 
-    # Page 5: Irrelevant filler
+
+def _draw_filler(c, W, H):
+    """Irrelevant filler page."""
     c.setFont("Helvetica", 12)
     c.drawString(72, H - 72, "MECHANICAL SYSTEMS")
     c.drawString(72, H - 100, "HVAC ductwork layout - not related to glass scope")
     c.drawString(72, H - 120, "Plumbing riser diagram")
     c.showPage()
 
+
+SYNTHETIC_PAGES = (
+    _draw_cover,
+    _draw_floor_plan,
+    _draw_schedule,
+    _draw_notes,
+    _draw_detail,
+    _draw_filler,
+)
+
+
+def build_synthetic_pdf(pages=SYNTHETIC_PAGES) -> bytes:
+    """Render a synthetic vector PDF in memory and return its bytes.
+
+    ``pages`` is a sequence of ``_draw_*`` functions, one per page; the
+    default is the full six-page set (cover, floor plan, schedule, notes,
+    detail, filler).
+
+    Plain function (no fixtures) so session-scoped fixtures can call it.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen.canvas import Canvas
+
+    buf = io.BytesIO()
+    c = Canvas(buf, pagesize=letter)
+    W, H = letter
+    for draw_page in pages:
+        draw_page(c, W, H)
     c.save()
-    return pdf_path
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def _synthetic_pdf_bytes() -> bytes:
+    """Run the ReportLab pipeline once per session."""
+    return build_synthetic_pdf()
+
+
+@pytest.fixture
+def synthetic_pdf_path(tmp_path, _synthetic_pdf_bytes) -> str:
+    """Write the cached synthetic PDF into this test's tmp dir."""
+    pdf_path = tmp_path / "synthetic-test.pdf"
+    pdf_path.write_bytes(_synthetic_pdf_bytes)
+    return str(pdf_path)
+
+
+@pytest.fixture(scope="session")
+def title_only_pdf(tmp_path_factory) -> str:
+    """One-page PDF with just the cover sheet (read-only)."""
+    pdf_path = tmp_path_factory.mktemp("synth_pdf") / "title-only.pdf"
+    pdf_path.write_bytes(build_synthetic_pdf((_draw_cover,)))
+    return str(pdf_path)
+
+
+@pytest.fixture(scope="session")
+def schedule_only_pdf(tmp_path_factory) -> str:
+    """One-page PDF with just the glass & mirror schedule (read-only)."""
+    pdf_path = tmp_path_factory.mktemp("synth_pdf") / "schedule-only.pdf"
+    pdf_path.write_bytes(build_synthetic_pdf((_draw_schedule,)))
+    return str(pdf_path)
@@ -1,42 +1,39 @@
 """Infra tests for disk pressure guard behavior."""
 
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 
 import pytest
 from src.disk import get_disk_usage_pct, is_disk_pressure
 
 
-class TestDiskPressureThresholds:
-    """Test disk pressure guard at various thresholds."""
+@pytest.fixture(autouse=True)
+def _fresh_disk_usage():
+    """Each test reads disk usage through its own patches, not the TTL cache."""
+    get_disk_usage_pct.cache_clear()
+    yield
+    get_disk_usage_pct.cache_clear()
 
-    @patch("src.disk.shutil.disk_usage")
-    def test_70_percent_no_pressure(self, mock_usage):
-        mock_usage.return_value = MagicMock(total=1000, used=700)
-        assert is_disk_pressure() is False
 
-    @patch("src.disk.shutil.disk_usage")
-    def test_79_percent_no_pressure(self, mock_usage):
-        mock_usage.return_value = MagicMock(total=1000, used=790)
-        assert is_disk_pressure() is False
+def _fake_usage(used, total=1000):
+    return lambda _path: SimpleNamespace(f_blocks=total, f_bfree=total - used)
 
-    @patch("src.disk.shutil.disk_usage")
-    def test_80_percent_triggers_pressure(self, mock_usage):
-        mock_usage.return_value = MagicMock(total=1000, used=800)
-        assert is_disk_pressure() is True
 
-    @patch("src.disk.shutil.disk_usage")
-    def test_95_percent_triggers_pressure(self, mock_usage):
-        mock_usage.return_value = MagicMock(total=1000, used=950)
-        assert is_disk_pressure() is True
+class TestDiskPressureThresholds:
+    """Test disk pressure guard at various thresholds."""
+
+    @pytest.mark.parametrize(
+        "used,expected",
+        [(700, False), (790, False), (800, True), (950, True), (1000, True)],
+    )
+    def test_thresholds(self, used, expected, monkeypatch):
+        monkeypatch.setattr("src.disk.os.statvfs", _fake_usage(used))
+        assert is_disk_pressure() is expected
 
-    @patch("src.disk.shutil.disk_usage")
-    def test_100_percent(self, mock_usage):
-        mock_usage.return_value = MagicMock(total=1000, used=1000)
-        assert is_disk_pressure() is True
+    def test_error_returns_no_pressure(self, monkeypatch):
+        def _raise(_path):
+            raise OSError("volume not found")
 
-    @patch("src.disk.shutil.disk_usage")
-    def test_error_returns_no_pressure(self, mock_usage):
-        mock_usage.side_effect = OSError("volume not found")
+        monkeypatch.setattr("src.disk.os.statvfs", _raise)
         # get_disk_usage_pct returns 0.0 on error, which is < 80
         assert is_disk_pressure() is False
 
@@ -44,14 +41,8 @@ class TestDiskPressureThresholds:
 class TestDiskUsageCustomThreshold:
     """Test with custom threshold via monkeypatch."""
 
-    @patch("src.disk.shutil.disk_usage")
-    def test_custom_threshold_50(self, mock_usage, monkeypatch):
-        monkeypatch.setattr("src.disk.config.DISK_PRESSURE_THRESHOLD_PCT", 50)
-        mock_usage.return_value = MagicMock(total=1000, used=500)
-        assert is_disk_pressure() is True
-
-    @patch("src.disk.shutil.disk_usage")
-    def test_custom_threshold_90(self, mock_usage, monkeypatch):
-        monkeypatch.setattr("src.disk.config.DISK_PRESSURE_THRESHOLD_PCT", 90)
-        mock_usage.return_value = MagicMock(total=1000, used=850)
-        assert is_disk_pressure() is False
+    @pytest.mark.parametrize("threshold,used,expected", [(50, 500, True), (90, 850, False)])
+    def test_custom_threshold(self, threshold, used, expected, monkeypatch):
+        monkeypatch.setattr("src.disk.config.DISK_PRESSURE_THRESHOLD_PCT", threshold)
+        monkeypatch.setattr("src.disk.os.statvfs", _fake_usage(used))
+        assert is_disk_pressure() is expected
@@ -3,54 +3,77 @@
 from unittest.mock import patch, MagicMock, call
 
 import pytest
+from minio.deleteobjects import DeleteError, DeleteObject
+
+from src.cleanup import (
+    cleanup_expired_storage_objects,
+    cleanup_stale_uploads,
+    emergency_page_cache_cleanup,
+)
+
+
+def _removed(mock_client):
+    """All ``(bucket, key)`` pairs passed to ``remove_objects``."""
+    return {
+        (bucket, obj.name)
+        for (bucket, objs), _ in mock_client.remove_objects.call_args_list
+        for obj in objs
+    }
 
 
 class TestCleanupExpiredStorageObjects:
     """Test cleanup_expired_storage_objects removes expected keys."""
 
     @patch("src.cleanup.get_client")
-    @patch("src.cleanup.get_cursor")
-    def test_deletes_expired_objects(self, mock_cursor_ctx, mock_get_client):
-        from src.cleanup import cleanup_expired_storage_objects
-
+    def test_deletes_expired_objects(self, mock_get_client, cleanup_db):
         mock_client = MagicMock()
         mock_get_client.return_value = mock_client
 
-        mock_cur = MagicMock()
-        mock_conn = MagicMock()
-        mock_cursor_ctx.return_value.__enter__ = MagicMock(return_value=(mock_cur, mock_conn))
-        mock_cursor_ctx.return_value.__exit__ = MagicMock(return_value=False)
-
-        expired_objects = [
-            {"id": "so-1", "bucket": "raw-uploads", "key": "proj/job/source.pdf", "job_id": "j1"},
-            {"id": "so-2", "bucket": "page-cache", "key": "j1/page-5.png", "job_id": "j1"},
+        cleanup_db.rows = [
+            ("so-1", "raw-uploads", "proj/job/source.pdf", "j1"),
+            ("so-2", "page-cache", "j1/page-5.png", "j1"),
         ]
-        mock_cur.fetchall.return_value = expired_objects
 
         count = cleanup_expired_storage_objects()
 
         assert count == 2
-        assert mock_client.remove_object.call_count == 2
-        mock_client.remove_object.assert_any_call("raw-uploads", "proj/job/source.pdf")
-        mock_client.remove_object.assert_any_call("page-cache", "j1/page-5.png")
-        mock_conn.commit.assert_called_once()
+        # One multi-object request per bucket
+        assert mock_client.remove_objects.call_count == 2
+        assert _removed(mock_client) == {
+            ("raw-uploads", "proj/job/source.pdf"),
+            ("page-cache", "j1/page-5.png"),
+        }
+        cleanup_db.conn.commit.assert_called_once()
 
     @patch("src.cleanup.get_client")
-    @patch("src.cleanup.get_cursor")
-    def test_handles_minio_remove_error_gracefully(self, mock_cursor_ctx, mock_get_client):
-        from src.cleanup import cleanup_expired_storage_objects
-
+    def test_batches_keys_per_bucket(self, mock_get_client, cleanup_db):
         mock_client = MagicMock()
         mock_get_client.return_value = mock_client
-        mock_client.remove_object.side_effect = Exception("S3 error")
 
-        mock_cur = MagicMock()
-        mock_conn = MagicMock()
-        mock_cursor_ctx.return_value.__enter__ = MagicMock(return_value=(mock_cur, mock_conn))
-        mock_cursor_ctx.return_value.__exit__ = MagicMock(return_value=False)
+        cleanup_db.rows = [
+            (f"so-{i}", "page-cache", f"j1/page-{i}.png", "j1")
+            for i in range(3)
+        ]
+
+        count = cleanup_expired_storage_objects()
+
+        assert count == 3
+        mock_client.remove_objects.assert_called_once_with(
+            "page-cache", [DeleteObject(f"j1/page-{i}.png") for i in range(3)],
+        )
+        # A single DELETE ... RETURNING both selects and drops the rows
+        assert len(cleanup_db.executed) == 1
+        assert "RETURNING" in cleanup_db.executed[0][0]
+        assert "SET LOCAL lock_timeout" in cleanup_db.executed[0][0]
+
+    @patch("src.cleanup.get_client")
+    def test_handles_minio_remove_error_gracefully(self, mock_get_client, cleanup_db):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.remove_objects.side_effect = Exception("S3 error")
 
-        mock_cur.fetchall.return_value = [
-            {"id": "so-1", "bucket": "outputs", "key": "bid.pdf", "job_id": "j1"},
+        cleanup_db.rows = [
+            ("so-1", "outputs", "bid.pdf", "j1"),
         ]
 
         count = cleanup_expired_storage_objects()
@@ -58,45 +81,103 @@ class TestCleanupExpiredStorageObjects:
         assert count == 1
 
     @patch("src.cleanup.get_client")
-    @patch("src.cleanup.get_cursor")
-    def test_no_expired_objects(self, mock_cursor_ctx, mock_get_client):
-        from src.cleanup import cleanup_expired_storage_objects
-
+    def test_per_key_delete_errors_do_not_abort(self, mock_get_client, cleanup_db):
         mock_client = MagicMock()
         mock_get_client.return_value = mock_client
+        mock_client.remove_objects.return_value = iter([
+            DeleteError(code="AccessDenied", message="denied", name="bid.pdf", version_id=None),
+        ])
 
-        mock_cur = MagicMock()
-        mock_conn = MagicMock()
-        mock_cursor_ctx.return_value.__enter__ = MagicMock(return_value=(mock_cur, mock_conn))
-        mock_cursor_ctx.return_value.__exit__ = MagicMock(return_value=False)
+        cleanup_db.rows = [
+            ("so-1", "outputs", "bid.pdf", "j1"),
+            ("so-2", "outputs", "shop.pdf", "j1"),
+        ]
 
-        mock_cur.fetchall.return_value = []
+        count = cleanup_expired_storage_objects()
+        assert count == 2
+        cleanup_db.conn.commit.assert_called_once()
+
+    @patch("src.cleanup.get_client")
+    def test_no_expired_objects(self, mock_get_client, cleanup_db):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
 
         count = cleanup_expired_storage_objects()
         assert count == 0
-        mock_client.remove_object.assert_not_called()
+        mock_client.remove_objects.assert_not_called()
 
 
-class TestEmergencyPageCacheCleanup:
-    """Test emergency page-cache cleanup."""
+class TestCleanupStaleUploads:
+    """Test cleanup_stale_uploads probes, then fails abandoned jobs in one statement."""
 
     @patch("src.cleanup.get_client")
-    @patch("src.cleanup.get_cursor")
-    def test_removes_oldest_page_cache_objects(self, mock_cursor_ctx, mock_get_client):
-        from src.cleanup import emergency_page_cache_cleanup
+    def test_empty_probe_returns_early(self, mock_get_client, cleanup_db):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        assert cleanup_stale_uploads() == 0
+        # Only the probe ran; the join and the write were skipped
+        assert len(cleanup_db.executed) == 1
+        probe_sql, _ = cleanup_db.executed[0]
+        assert probe_sql.startswith("SET LOCAL lock_timeout")
+        assert "LIMIT 1" in probe_sql
+        mock_client.remove_objects.assert_not_called()
+        cleanup_db.conn.commit.assert_called_once()
 
+    @patch("src.cleanup.get_client")
+    def test_jobs_without_storage_rows(self, mock_get_client, cleanup_db):
         mock_client = MagicMock()
         mock_get_client.return_value = mock_client
+        cleanup_db.rows = [
+            ("j1", "p1", None, None, None),
+            ("j2", "p1", None, None, None),
+        ]
+
+        assert cleanup_stale_uploads() == 2
+        mock_client.remove_objects.assert_not_called()
+        update_sql, params = cleanup_db.executed[-1]
+        assert "UPLOAD_ABANDONED" in update_sql
+        assert params == ([], ["j1", "j2"])
 
-        mock_cur = MagicMock()
-        mock_conn = MagicMock()
-        mock_cursor_ctx.return_value.__enter__ = MagicMock(return_value=(mock_cur, mock_conn))
-        mock_cursor_ctx.return_value.__exit__ = MagicMock(return_value=False)
+    @patch("src.cleanup.get_client")
+    def test_ids_passed_to_delete_and_update(self, mock_get_client, cleanup_db):
+        mock_client = MagicMock()
+        mock_client.remove_objects.return_value = iter([])
+        mock_get_client.return_value = mock_client
+        cleanup_db.rows = [
+            ("j1", "p1", "so-1", "raw-uploads", "p1/j1/source.pdf"),
+            ("j1", "p1", "so-2", "raw-uploads", "p1/j1/part-2"),
+            ("j2", "p2", None, None, None),
+        ]
+
+        assert cleanup_stale_uploads() == 3
+        assert _removed(mock_client) == {
+            ("raw-uploads", "p1/j1/source.pdf"),
+            ("raw-uploads", "p1/j1/part-2"),
+        }
+        # probe, join, then one DELETE ... UPDATE statement
+        assert len(cleanup_db.executed) == 3
+        assert cleanup_db.executed[-1][1] == (["so-1", "so-2"], ["j1", "j2"])
+        cleanup_db.conn.commit.assert_called_once()
+
+
+class TestEmergencyPageCacheCleanup:
+    """Test emergency page-cache cleanup."""
+
+    @patch("src.cleanup.get_client")
+    def test_removes_oldest_page_cache_objects(self, mock_get_client, cleanup_db):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
 
-        mock_cur.fetchall.return_value = [
-            {"id": "so-1", "bucket": "page-cache", "key": "old-thumb.png"},
+        cleanup_db.rows = [
+            ("so-1", "page-cache", "old-thumb.png"),
         ]
 
         count = emergency_page_cache_cleanup()
         assert count == 1
-        mock_client.remove_object.assert_called_once_with("page-cache", "old-thumb.png")
+        mock_client.remove_objects.assert_called_once_with(
+            "page-cache", [DeleteObject("old-thumb.png")],
+        )
+        select_sql, _ = cleanup_db.executed[0]
+        assert select_sql.startswith("SET LOCAL lock_timeout")
+        assert cleanup_db.executed[-1][1] == (["so-1"],)
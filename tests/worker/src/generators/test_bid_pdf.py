@@ -1,16 +1,20 @@
 """Tests for Bid PDF generation (worker/src/generators/bid_pdf.py)."""
 
+import io
 import os
 import pytest
 import fitz  # PyMuPDF
 
+from fixtures.conftest import ssot_with_overrides
+from src.generators.bid_pdf import (
+    NormalizedItem, _format_item_dims, _get_styles, _normalize_items, generate_bid_pdf,
+)
+
 
 class TestGenerateBidPdf:
     """Functional tests for bid PDF generation from golden SSOT."""
 
     def test_generates_valid_pdf(self, golden_ssot, tmp_output_dir):
-        from src.generators.bid_pdf import generate_bid_pdf
-
         output = os.path.join(tmp_output_dir, "bid.pdf")
         result = generate_bid_pdf(golden_ssot, output)
 
@@ -18,86 +22,106 @@ class TestGenerateBidPdf:
         assert os.path.exists(output)
         assert os.path.getsize(output) > 0
 
-    def test_pdf_has_multiple_pages(self, golden_ssot, tmp_output_dir):
-        from src.generators.bid_pdf import generate_bid_pdf
-
-        output = os.path.join(tmp_output_dir, "bid.pdf")
-        generate_bid_pdf(golden_ssot, output)
-
-        doc = fitz.open(output)
-        assert len(doc) >= 4  # Cover + TOC + Content + Terms
-        doc.close()
-
-    def test_cover_page_contains_project_name(self, golden_ssot, tmp_output_dir):
-        from src.generators.bid_pdf import generate_bid_pdf
-
-        output = os.path.join(tmp_output_dir, "bid.pdf")
-        generate_bid_pdf(golden_ssot, output)
-
-        doc = fitz.open(output)
-        cover_text = doc[0].get_text("text")
-        assert "LUXURIUS GLASS" in cover_text
-        assert "Marina Bay Residences" in cover_text
-        doc.close()
-
-    def test_pricing_total_appears(self, golden_ssot, tmp_output_dir):
-        from src.generators.bid_pdf import generate_bid_pdf
-
-        output = os.path.join(tmp_output_dir, "bid.pdf")
-        generate_bid_pdf(golden_ssot, output)
+    def test_pdf_has_multiple_pages(self, bid_pdf_path):
+        with fitz.open(bid_pdf_path) as doc:
+            assert len(doc) >= 4  # Cover + TOC + Content + Terms
 
-        doc = fitz.open(output)
-        all_text = ""
-        for page in doc:
-            all_text += page.get_text("text")
-        doc.close()
+    def test_cover_page_contains_project_name(self, bid_cover_text):
+        missing = [t for t in ("LUXURIUS GLASS", "Marina Bay Residences") if t not in bid_cover_text]
+        assert not missing, missing
 
+    def test_pricing_total_appears(self, bid_pdf_all_text):
         # $104,800.00 total should appear
-        assert "104,800" in all_text
-
-    def test_section_headers_present(self, golden_ssot, tmp_output_dir):
-        from src.generators.bid_pdf import generate_bid_pdf
-
-        output = os.path.join(tmp_output_dir, "bid.pdf")
-        generate_bid_pdf(golden_ssot, output)
-
-        doc = fitz.open(output)
-        all_text = ""
-        for page in doc:
-            all_text += page.get_text("text")
-        doc.close()
+        assert "104,800" in bid_pdf_all_text
 
-        assert "Executive Summary" in all_text
-        assert "Scope of Work" in all_text
-        assert "Pricing Breakdown" in all_text
-        assert "Assumptions" in all_text
+    def test_section_headers_present(self, bid_pdf_all_text):
+        required = ("Executive Summary", "Scope of Work", "Pricing Breakdown", "Assumptions")
+        missing = [t for t in required if t not in bid_pdf_all_text]
+        assert not missing, missing
 
-    def test_alternates_section_present(self, golden_ssot, tmp_output_dir):
-        from src.generators.bid_pdf import generate_bid_pdf
-
-        output = os.path.join(tmp_output_dir, "bid.pdf")
-        generate_bid_pdf(golden_ssot, output)
-
-        doc = fitz.open(output)
-        all_text = ""
-        for page in doc:
-            all_text += page.get_text("text")
-        doc.close()
-
-        assert "Alternates" in all_text
-        assert "ALT-1" in all_text
+    def test_alternates_section_present(self, bid_pdf_all_text):
+        missing = [t for t in ("Alternates", "ALT-1") if t not in bid_pdf_all_text]
+        assert not missing, missing
 
     def test_handles_empty_items_gracefully(self, golden_ssot, tmp_output_dir):
-        from src.generators.bid_pdf import generate_bid_pdf
-        import copy
-
-        ssot = copy.deepcopy(golden_ssot)
-        ssot["items"] = []
-        ssot["pricing"]["lineItems"] = []
-        ssot["pricing"]["subtotal"] = 0
-        ssot["pricing"]["total"] = 0
+        ssot = ssot_with_overrides(
+            golden_ssot,
+            items=[],
+            pricing={"lineItems": [], "subtotal": 0, "total": 0},
+        )
 
         output = os.path.join(tmp_output_dir, "bid-empty.pdf")
         result = generate_bid_pdf(ssot, output)
         assert os.path.exists(result)
         assert os.path.getsize(result) > 0
+
+    def test_renders_into_stream(self, golden_ssot):
+        buf = io.BytesIO()
+        assert generate_bid_pdf(golden_ssot, buf) is buf
+        doc = fitz.open(stream=buf.getvalue(), filetype="pdf")
+        assert doc.page_count > 1
+
+    def test_cover_escapes_markup_in_metadata(self, golden_ssot):
+        ssot = ssot_with_overrides(golden_ssot, metadata={"clientName": "Smith & <Sons>"})
+        buf = io.BytesIO()
+        generate_bid_pdf(ssot, buf)
+        with fitz.open(stream=buf.getvalue(), filetype="pdf") as doc:
+            assert "Smith & <Sons>" in doc[0].get_text()
+
+    def test_long_scope_table_repeats_header(self, golden_ssot):
+        item = dict(golden_ssot["items"][0], unitId="Type-A")
+        ssot = ssot_with_overrides(golden_ssot, items=[item] * 80)
+        buf = io.BytesIO()
+        generate_bid_pdf(ssot, buf)
+        with fitz.open(stream=buf.getvalue(), filetype="pdf") as doc:
+            header_pages = [p for p in doc if "Configuration" in p.get_text() and "Unit: Type-A" not in p.get_text()]
+            assert header_pages, "scope table should continue on a new page with its header"
+
+    def test_long_document_builds_repeatedly(self, golden_ssot):
+        # Separators pushed to a new page are marked as postponed by platypus;
+        # flowable instances must not be shared across sections or builds.
+        line_item = golden_ssot["pricing"]["lineItems"][0]
+        ssot = ssot_with_overrides(
+            golden_ssot,
+            pricing={"lineItems": [line_item] * 26},
+            assumptions=[f"Assumption {i}" for i in range(21)],
+        )
+        for _ in range(2):
+            buf = io.BytesIO()
+            generate_bid_pdf(ssot, buf)
+            assert buf.getvalue().startswith(b"%PDF")
+
+    def test_styles_built_once(self):
+        assert _get_styles() is _get_styles()
+        assert "BodyText2" in _get_styles()
+
+
+class TestNormalizeItems:
+    """Test the flattened item view shared by the summary and scope sections."""
+
+    def test_flattens_fields_and_defaults(self):
+        full, bare = _normalize_items([
+            {
+                "unitId": "A", "category": "SHOWER_ENCLOSURE", "configuration": "inline-panel",
+                "dimensions": {"width": {"value": 36}, "height": {"value": 72}},
+                "flags": ["TO_BE_VERIFIED_IN_FIELD"], "glassType": "3/8 clear", "quantityPerUnit": 2,
+            },
+            {},
+        ])
+        assert full == NormalizedItem("A", "SHOWER_ENCLOSURE", "Inline Panel", 36, 72, True, "3/8 clear", 2)
+        assert bare == NormalizedItem("General", None, "", None, None, False, "", 1)
+        assert not hasattr(full, "__dict__")
+
+
+class TestFormatItemDims:
+    """Test scope-table dimension text."""
+
+    @pytest.mark.parametrize("w,h,expected", [
+        pytest.param(36, 72, '36" x 72"', id="whole"),
+        pytest.param(36.4, 71.6, '36" x 72"', id="rounded"),
+        pytest.param(30.0, None, '30" W', id="width-only"),
+        pytest.param(None, 80.5, '80" H', id="height-only-half-even"),
+        pytest.param(None, None, "TBV", id="missing"),
+    ])
+    def test_format(self, w, h, expected):
+        assert _format_item_dims(w, h) == expected
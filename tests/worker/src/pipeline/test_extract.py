@@ -1,6 +1,7 @@
 """Tests for extraction helpers (worker/src/pipeline/extract.py)."""
 
 import pytest
+from src.pipeline import extract
 from src.pipeline.extract import (
     _parse_dimension_inches,
     _parse_inches,
@@ -11,6 +12,29 @@ from src.pipeline.extract import (
 )
 
 
+# Module-level corpora so the case ids are built once at collection and
+# the shortest inputs run first.
+_CONFIG_CASES = (
+    pytest.param("vanity mirror rectangular", "vanity-mirror", id="vanity"),
+    pytest.param("panel and door inline", "inline-panel-door", id="inline-panel-door"),
+    pytest.param("bypass shower sliding", "frameless-sliding", id="sliding"),
+    pytest.param("random text no keywords", None, id="no-match"),
+    pytest.param("bathtub panel fixed mount", "bathtub-fixed-panel", id="bathtub"),
+    pytest.param("steam shower with transom", "steam-shower", id="steam"),
+    # "corner door" keyword triggers 90-degree-corner-door
+    pytest.param(
+        "corner door frameless enclosure", "90-degree-corner-door", id="90-degree-corner-door",
+    ),
+    # "90 degree corner" matches first, before "90 degree corner door"
+    pytest.param("90 degree corner door enclosure", "90-degree-corner", id="90-degree-corner"),
+)
+
+_WXH_CASES = (
+    pytest.param('36" x 78"', 36.0, 78.0, id="inches"),
+    pytest.param("3'-0\" x 6'-6\"", 36.0, 78.0, id="feet-inches"),
+)
+
+
 class TestParseInches:
     """Test the _parse_inches helper."""
 
@@ -79,48 +103,30 @@ class TestDetectCategory:
         assert _detect_category("plumbing riser diagram") is None
 
 
-class TestDetectConfiguration:
-    """Test _detect_configuration keyword matching."""
-
-    def test_inline_panel_door(self):
-        assert _detect_configuration("panel and door inline") == "inline-panel-door"
-
-    def test_90_degree_corner(self):
-        # "90 degree corner" matches first, before "90 degree corner door"
-        assert _detect_configuration("90 degree corner door enclosure") == "90-degree-corner"
-
-    def test_90_degree_corner_door(self):
-        # "corner door" keyword triggers 90-degree-corner-door
-        assert _detect_configuration("corner door frameless enclosure") == "90-degree-corner-door"
+class TestKeywordTables:
+    """Guard the immutable keyword tables the detectors scan."""
 
-    def test_bathtub(self):
-        assert _detect_configuration("bathtub panel fixed mount") == "bathtub-fixed-panel"
+    @pytest.mark.parametrize("name", ["SHOWER_KEYWORDS", "MIRROR_KEYWORDS"])
+    def test_category_keywords_are_frozenset(self, name):
+        assert isinstance(getattr(extract, name), frozenset)
 
-    def test_vanity(self):
-        assert _detect_configuration("vanity mirror rectangular") == "vanity-mirror"
 
-    def test_sliding(self):
-        assert _detect_configuration("bypass shower sliding") == "frameless-sliding"
-
-    def test_steam(self):
-        assert _detect_configuration("steam shower with transom") == "steam-shower"
+class TestDetectConfiguration:
+    """Test _detect_configuration keyword matching."""
 
-    def test_no_match(self):
-        assert _detect_configuration("random text no keywords") is None
+    @pytest.mark.parametrize("text,expected", _CONFIG_CASES)
+    def test_detect(self, text, expected):
+        assert _detect_configuration(text) == expected
 
 
 class TestExtractDimensionsFromText:
     """Test _extract_dimensions_from_text WxH patterns and labeled dims."""
 
-    def test_wxh_pattern(self):
-        dims = _extract_dimensions_from_text('36" x 78"')
-        assert dims["width"] == 36.0
-        assert dims["height"] == 78.0
-
-    def test_feet_inches_wxh(self):
-        dims = _extract_dimensions_from_text("3'-0\" x 6'-6\"")
-        assert dims["width"] == 36.0
-        assert dims["height"] == 78.0
+    @pytest.mark.parametrize("text,w,h", _WXH_CASES)
+    def test_wxh(self, text, w, h):
+        dims = _extract_dimensions_from_text(text)
+        assert dims["width"] == w
+        assert dims["height"] == h
 
     def test_labeled_dims(self):
         # The labeled-dim regex matches "height" before "h:" so the first 
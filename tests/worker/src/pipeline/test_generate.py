@@ -1,82 +1,110 @@
 """Tests for generation stage (worker/src/pipeline/generate.py)."""
 
-import os
+import hashlib
 import json
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import MagicMock
 
+import src.pipeline.generate as g
 from src.pipeline.generate import run_generation, _compute_sha256
 
+pytestmark = pytest.mark.xdist_group("generate")
 
-class TestComputeSha256:
-    """Test the SHA256 hash computation helper."""
 
-    def test_computes_hash(self, tmp_path):
-        """Compute SHA256 of a known file."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("hello world")
+class _FakeError:
+    """Minimal stand-in for ValidationError: only ``code`` and ``to_dict()``."""
+
+    __slots__ = ("code", "_d")
+
+    def __init__(self, code, d):
+        self.code = code
+        self._d = d
 
-        result = _compute_sha256(str(test_file))
+    def to_dict(self):
+        return self._d
 
-        assert isinstance(result, str)
-        assert len(result) == 64  # SHA256 hex digest is 64 chars
-        # Known SHA256 of "hello world"
-        assert result == "b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9"
 
-    def test_empty_file(self, tmp_path):
-        """Empty file has a valid hash."""
-        test_file = tmp_path / "empty.txt"
-        test_file.write_text("")
+@pytest.fixture
+def gen_mocks(monkeypatch):
+    """Replace every collaborator of run_generation with a MagicMock."""
+    mocks = SimpleNamespace(
+        validate=MagicMock(return_value=[]),
+        gen_bid=MagicMock(),
+        status=MagicMock(),
+        cursor=MagicMock(),
+        upload=MagicMock(),
+        sha=MagicMock(return_value="a" * 64),
+    )
+    for name, mock in [
+        ("validate_ssot_for_generation", mocks.validate),
+        ("generate_bid_pdf", mocks.gen_bid),
+        ("update_job_status", mocks.status),
+        ("get_cursor", mocks.cursor),
+        ("upload_file", mocks.upload),
+        ("_compute_sha256", mocks.sha),
+    ]:
+        monkeypatch.setattr(g, name, mock)
+    monkeypatch.setattr(g.os, "makedirs", lambda *a, **k: None)
+    monkeypatch.setattr(g.os.path, "getsize", lambda path: 5000)
+    cm = MagicMock()
+    mocks.cursor.return_value.__enter__.return_value = (cm, cm)
+    return mocks
+
+
+@pytest.fixture(scope="session")
+def ssot_json_string():
+    """Minimal generatable SSOT, serialized once for the string-input path."""
+    return json.dumps({"items": [{"itemId": "i1"}], "pricing": {"total": 100}, "outputs": []})
+
+
+class TestComputeSha256:
+    """Test the SHA256 hash computation helper."""
 
-        result = _compute_sha256(str(test_file))
+    @pytest.mark.parametrize("content,expected", [
+        pytest.param(
+            b"hello world",
+            "b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9",
+            id="known",
+        ),
+        pytest.param(b"", hashlib.sha256(b"").hexdigest(), id="empty"),
+    ])
+    def test_sha(self, tmp_path, content, expected):
+        """Hex digest matches the reference SHA256 of the file bytes."""
+        test_file = tmp_path / "f"
+        test_file.write_bytes(content)
 
-        assert isinstance(result, str)
-        assert len(result) == 64
+        assert _compute_sha256(str(test_file)) == expected
 
 
 class TestRunGeneration:
     """Test the run_generation pipeline function."""
 
-    @patch("src.pipeline.generate.upload_file")
-    @patch("src.pipeline.generate.get_cursor")
-    @patch("src.pipeline.generate.update_job_status")
-    @patch("src.pipeline.generate.generate_bid_pdf")
-    @patch("src.pipeline.generate.validate_ssot_for_generation")
-    def test_validation_failure_blocks_generation(
-        self, mock_validate, mock_gen_bid, mock_status, mock_cursor, mock_upload
-    ):
+    pytestmark = pytest.mark.usefixtures("gen_mocks")
+
+    def test_validation_failure_blocks_generation(self, gen_mocks):
         """If validation returns blocking errors, generation should FAIL."""
-        error = MagicMock()
-        error.code = "NO_ITEMS"
-        error.to_dict.return_value = {"code": "NO_ITEMS", "message": "No items"}
-        mock_validate.return_value = [error]
+        error = _FakeError("NO_ITEMS", {"code": "NO_ITEMS", "message": "No items"})
+        gen_mocks.validate.return_value = [error]
 
         job = {"id": "j1", "project_id": "p1", "ssot": {"items": [], "pricing": {"total": 0}}}
 
         run_generation(job)
 
-        mock_gen_bid.assert_not_called()
-        calls = mock_status.call_args_list
+        gen_mocks.gen_bid.assert_not_called()
+        calls = gen_mocks.status.call_args_list
         failed_call = [c for c in calls if c[0][1] == "FAILED"]
         assert len(failed_call) == 1
 
-    @patch("src.pipeline.generate.upload_file")
-    @patch("src.pipeline.generate.get_cursor")
-    @patch("src.pipeline.generate.update_job_status")
-    @patch("src.pipeline.generate.generate_bid_pdf")
-    @patch("src.pipeline.generate.validate_ssot_for_generation")
-    def test_warnings_dont_block_generation(
-        self, mock_validate, mock_gen_bid, mock_status, mock_cursor, mock_upload
-    ):
+    def test_warnings_dont_block_generation(self, gen_mocks):
         """Validation warnings (code contains WARNING) should not block."""
-        warning = MagicMock()
-        warning.code = "LOW_CONFIDENCE_WARNING"
-        warning.to_dict.return_value = {"code": "LOW_CONFIDENCE_WARNING"}
-        mock_validate.return_value = [warning]
-
-        mock_cm = MagicMock()
-        mock_cursor.return_value.__enter__ = MagicMock(return_value=(mock_cm, mock_cm))
-        mock_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        warning = _FakeError("LOW_CONFIDENCE_WARNING", {"code": "LOW_CONFIDENCE_WARNING"})
+        gen_mocks.validate.return_value = [warning]
 
         job = {
             "id": "j1",
@@ -84,57 +112,27 @@ class TestRunGeneration:
             "ssot": {"items": [{"itemId": "i1"}], "pricing": {"total": 100}, "outputs": []},
         }
 
-        with patch("src.pipeline.generate.os.makedirs"):
-            with patch("src.pipeline.generate.os.path.getsize", return_value=5000):
-                with patch("src.pipeline.generate._compute_sha256", return_value="a" * 64):
-                    run_generation(job)
-
-        mock_gen_bid.assert_called_once()
-
-    @patch("src.pipeline.generate.upload_file")
-    @patch("src.pipeline.generate.get_cursor")
-    @patch("src.pipeline.generate.update_job_status")
-    @patch("src.pipeline.generate.generate_bid_pdf")
-    @patch("src.pipeline.generate.validate_ssot_for_generation")
-    def test_successful_generation_transitions_to_done(
-        self, mock_validate, mock_gen_bid, mock_status, mock_cursor, mock_upload
-    ):
-        """Successful generation should transition job to DONE."""
-        mock_validate.return_value = []
+        run_generation(job)
 
-        mock_cm = MagicMock()
-        mock_cursor.return_value.__enter__ = MagicMock(return_value=(mock_cm, mock_cm))
-        mock_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        gen_mocks.gen_bid.assert_called_once()
 
+    def test_successful_generation_transitions_to_done(self, gen_mocks):
+        """Successful generation should transition job to DONE."""
         job = {
             "id": "j1",
             "project_id": "p1",
             "ssot": {"items": [{"itemId": "i1"}], "pricing": {"total": 100}, "outputs": []},
         }
 
-        with patch("src.pipeline.generate.os.makedirs"):
-            with patch("src.pipeline.generate.os.path.getsize", return_value=5000):
-                with patch("src.pipeline.generate._compute_sha256", return_value="a" * 64):
-                    run_generation(job)
+        run_generation(job)
 
-        calls = mock_status.call_args_list
+        calls = gen_mocks.status.call_args_list
         done_call = [c for c in calls if c[0][1] == "DONE"]
         assert len(done_call) == 1
 
-    @patch("src.pipeline.generate.upload_file")
-    @patch("src.pipeline.generate.get_cursor")
-    @patch("src.pipeline.generate.update_job_status")
-    @patch("src.pipeline.generate.generate_bid_pdf")
-    @patch("src.pipeline.generate.validate_ssot_for_generation")
-    def test_bid_pdf_output_in_ssot(
-        self, mock_validate, mock_gen_bid, mock_status, mock_cursor, mock_upload
-    ):
+    def test_bid_pdf_output_in_ssot(self, gen_mocks):
         """Generated BID_PDF should be recorded in SSOT outputs."""
-        mock_validate.return_value = []
-
-        mock_cm = MagicMock()
-        mock_cursor.return_value.__enter__ = MagicMock(return_value=(mock_cm, mock_cm))
-        mock_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        gen_mocks.sha.return_value = "b" * 64
 
         job = {
             "id": "j1",
@@ -142,12 +140,9 @@ class TestRunGeneration:
             "ssot": {"items": [{"itemId": "i1"}], "pricing": {"total": 100}, "outputs": []},
         }
 
-        with patch("src.pipeline.generate.os.makedirs"):
-            with patch("src.pipeline.generate.os.path.getsize", return_value=5000):
-                with patch("src.pipeline.generate._compute_sha256", return_value="b" * 64):
-                    run_generation(job)
+        run_generation(job)
 
-        calls = mock_status.call_args_list
+        calls = gen_mocks.status.call_args_list
         done_call = [c for c in calls if c[0][1] == "DONE"][0]
         ssot = done_call[1]["ssot"]
         outputs = ssot.get("outputs", [])
@@ -156,20 +151,9 @@ class TestRunGeneration:
         assert bid_outputs[0]["version"] == 1
         assert bid_outputs[0]["sha256"] == "b" * 64
 
-    @patch("src.pipeline.generate.upload_file")
-    @patch("src.pipeline.generate.get_cursor")
-    @patch("src.pipeline.generate.update_job_status")
-    @patch("src.pipeline.generate.generate_bid_pdf")
-    @patch("src.pipeline.generate.validate_ssot_for_generation")
-    def test_version_increments_on_existing_output(
-        self, mock_validate, mock_gen_bid, mock_status, mock_cursor, mock_upload
-    ):
+    def test_version_increments_on_existing_output(self, gen_mocks):
         """Bid version should increment if previous BID_PDF exists."""
-        mock_validate.return_value = []
-
-        mock_cm = MagicMock()
-        mock_cursor.return_value.__enter__ = MagicMock(return_value=(mock_cm, mock_cm))
-        mock_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        gen_mocks.sha.return_value = "c" * 64
 
         job = {
             "id": "j1",
@@ -181,53 +165,27 @@ class TestRunGeneration:
             },
         }
 
-        with patch("src.pipeline.generate.os.makedirs"):
-            with patch("src.pipeline.generate.os.path.getsize", return_value=5000):
-                with patch("src.pipeline.generate._compute_sha256", return_value="c" * 64):
-                    run_generation(job)
+        run_generation(job)
 
-        calls = mock_status.call_args_list
+        calls = gen_mocks.status.call_args_list
         done_call = [c for c in calls if c[0][1] == "DONE"][0]
         outputs = done_call[1]["ssot"]["outputs"]
         bid_outputs = [o for o in outputs if o.get("type") == "BID_PDF"]
         assert bid_outputs[0]["version"] == 2
 
-    @patch("src.pipeline.generate.upload_file")
-    @patch("src.pipeline.generate.get_cursor")
-    @patch("src.pipeline.generate.update_job_status")
-    @patch("src.pipeline.generate.generate_bid_pdf")
-    @patch("src.pipeline.generate.validate_ssot_for_generation")
-    def test_ssot_string_parsed(
-        self, mock_validate, mock_gen_bid, mock_status, mock_cursor, mock_upload
-    ):
+    def test_ssot_string_parsed(self, gen_mocks, ssot_json_string):
         """SSOT provided as JSON string should be parsed."""
-        mock_validate.return_value = []
-
-        mock_cm = MagicMock()
-        mock_cursor.return_value.__enter__ = MagicMock(return_value=(mock_cm, mock_cm))
-        mock_cursor.return_value.__exit__ = MagicMock(return_value=False)
-
-        ssot = {"items": [{"itemId": "i1"}], "pricing": {"total": 100}, "outputs": []}
-        job = {"id": "j1", "project_id": "p1", "ssot": json.dumps(ssot)}
-
-        with patch("src.pipeline.generate.os.makedirs"):
-            with patch("src.pipeline.generate.os.path.getsize", return_value=5000):
-                with patch("src.pipeline.generate._compute_sha256", return_value="d" * 64):
-                    run_generation(job)
-
-        mock_gen_bid.assert_called_once()
-
-    @patch("src.pipeline.generate.upload_file")
-    @patch("src.pipeline.generate.get_cursor")
-    @patch("src.pipeline.generate.update_job_status")
-    @patch("src.pipeline.generate.generate_bid_pdf")
-    @patch("src.pipeline.generate.validate_ssot_for_generation")
-    def test_bid_pdf_failure_raises(
-        self, mock_validate, mock_gen_bid, mock_status, mock_cursor, mock_upload
-    ):
+        gen_mocks.sha.return_value = "d" * 64
+
+        job = {"id": "j1", "project_id": "p1", "ssot": ssot_json_string}
+
+        run_generation(job)
+
+        gen_mocks.gen_bid.assert_called_once()
+
+    def test_bid_pdf_failure_raises(self, gen_mocks):
         """If bid PDF generation fails, the error should propagate."""
-        mock_validate.return_value = []
-        mock_gen_bid.side_effect = RuntimeError("ReportLab error")
+        gen_mocks.gen_bid.side_effect = RuntimeError("ReportLab error")
 
         job = {
             "id": "j1",
@@ -235,6 +193,97 @@ class TestRunGeneration:
             "ssot": {"items": [{"itemId": "i1"}], "pricing": {"total": 100}, "outputs": []},
         }
 
-        with patch("src.pipeline.generate.os.makedirs"):
-            with pytest.raises(RuntimeError, match="ReportLab error"):
-                run_generation(job)
+        with pytest.raises(RuntimeError, match="ReportLab error"):
+            run_generation(job)
+
+
+class _SyncPool:
+    """ProcessPoolExecutor stand-in that runs submissions inline.
+
+    With ``broken=True`` every future fails as if its child process died.
+    """
+
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.submitted = []
+        self.shutdown_calls = 0
+
+    def submit(self, fn, *args):
+        self.submitted.append(fn)
+        future = Future()
+        if self.broken:
+            future.set_exception(BrokenProcessPool("child process terminated abruptly"))
+        else:
+            future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutdown_calls += 1
+
+
+class TestPdfRenderPool:
+    """Test the PDF_RENDER_PROCESSES > 0 path of run_generation."""
+
+    JOB = {
+        "id": "j1",
+        "project_id": "p1",
+        "ssot": {"items": [{"itemId": "i1"}], "pricing": {"total": 100}, "outputs": []},
+    }
+
+    @pytest.fixture
+    def pools(self, gen_mocks, monkeypatch):
+        """Enable the pool; each ProcessPoolExecutor() call takes the next pool."""
+        created = []
+        queue = []
+
+        def factory(**kwargs):
+            created.append(queue.pop(0))
+            return created[-1]
+
+        monkeypatch.setattr(g.config, "PDF_RENDER_PROCESSES", 2)
+        monkeypatch.setattr(g, "ProcessPoolExecutor", factory)
+        monkeypatch.setattr(g, "_pdf_pool", None)
+        self.shop = MagicMock()
+        monkeypatch.setattr("src.generators.shop_drawings_pdf.generate_shop_drawings_pdf", self.shop)
+        return SimpleNamespace(queue=queue, created=created)
+
+    def _job(self):
+        return json.loads(json.dumps(self.JOB))
+
+    def test_renders_through_pool(self, gen_mocks, pools):
+        pool = _SyncPool()
+        pools.queue.append(pool)
+
+        run_generation(self._job())
+
+        assert pool.submitted == [self.shop, gen_mocks.gen_bid]
+        gen_mocks.gen_bid.assert_called_once()
+        assert [c[0][1] for c in gen_mocks.status.call_args_list][-1] == "DONE"
+        assert g._pdf_pool is pool
+
+    def test_broken_pool_falls_back_and_is_replaced(self, gen_mocks, pools):
+        broken, fresh = _SyncPool(broken=True), _SyncPool()
+        pools.queue.extend([broken, fresh])
+
+        run_generation(self._job())
+
+        # Both PDFs rendered in-process after the pool died
+        gen_mocks.gen_bid.assert_called_once()
+        self.shop.assert_called_once()
+        assert [c[0][1] for c in gen_mocks.status.call_args_list][-1] == "DONE"
+        assert broken.shutdown_calls >= 1
+        assert g._pdf_pool is None
+
+        # The next job gets a new pool instead of the dead one
+        run_generation(self._job())
+        assert pools.created == [broken, fresh]
+        assert fresh.submitted == [self.shop, gen_mocks.gen_bid]
+
+    def test_real_child_crash_is_recovered(self, monkeypatch):
+        pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        monkeypatch.setattr(g, "_pdf_pool", pool)
+
+        result = g._render_pdf(pool, pool.submit(os._exit, 1), lambda: "in-process")
+
+        assert result == "in-process"
+        assert g._pdf_pool is None
@@ -4,19 +4,46 @@ import pytest
 from src.pipeline.index import classify_page, detect_relevance
 
 
+# classify_page truth table: (text, page_num, total_pages, expected_cls, min_conf)
+CASES = [
+    pytest.param("Cover Sheet - Drawing Index", 0, 50, "TITLE", 0.4, id="title-first-page"),
+    pytest.param("Sheet Index - Table of Contents", 1, 50, "TITLE", None, id="title-second-page"),
+    pytest.param("Floor Plan - Level 3 Layout", 5, 50, "FLOOR_PLAN", 0.4, id="floor-plan"),
+    pytest.param("Interior Elevation - Master Bath", 10, 50, "ELEVATION", None, id="elevation"),
+    pytest.param(
+        "Glass Schedule - Door Schedule Reference", 15, 50, "SCHEDULE", None, id="schedule",
+    ),
+    pytest.param(
+        "Typical Detail - Shower Detail SD-5 Enlarged", 20, 50, "DETAIL", None, id="detail",
+    ),
+    pytest.param("General Notes and Specifications", 25, 50, "NOTES", None, id="notes"),
+    pytest.param("Page intentionally left blank", 40, 50, "IRRELEVANT", None, id="low-score"),
+]
+
+
+RELEVANCE_CASES = [
+    pytest.param("Frameless shower enclosure detail", {"showers"}, id="shower"),
+    pytest.param("Vanity mirror specification", {"mirrors", "assumptions"}, id="mirror"),
+    pytest.param("General notes and assumptions section", {"assumptions"}, id="assumptions"),
+    pytest.param(
+        "Shower enclosure and vanity mirror schedule with assumptions",
+        {"showers", "mirrors", "assumptions"},
+        id="multiple-categories",
+    ),
+    pytest.param("HVAC ductwork riser diagram", set(), id="no-matches"),
+    pytest.param("SHOWER ENCLOSURE SPECIFICATION", {"showers", "assumptions"}, id="case-insensitive"),
+]
+
+
 class TestClassifyPage:
     """Test classify_page keyword-based classification."""
 
-    def test_title_on_first_page(self):
-        text = "Cover Sheet - Drawing Index"
-        cls, conf = classify_page(text, page_num=0, total_pages=50)
-        assert cls == "TITLE"
-        assert conf >= 0.4
-
-    def test_title_on_second_page(self):
-        text = "Sheet Index - Table of Contents"
-        cls, conf = classify_page(text, page_num=1, total_pages=50)
-        assert cls == "TITLE"
+    @pytest.mark.parametrize("text,page_num,total_pages,expected_cls,min_conf", CASES)
+    def test_classify(self, text, page_num, total_pages, expected_cls, min_conf):
+        cls, conf = classify_page(text, page_num=page_num, total_pages=total_pages)
+        assert cls == expected_cls
+        if min_conf is not None:
+            assert conf >= min_conf
 
     def test_title_keyword_not_on_first_pages(self):
         text = "Cover Sheet"
@@ -25,32 +52,6 @@ class TestClassifyPage:
         # Still could match if keywords score highest.
         assert cls in ("TITLE", "IRRELEVANT")
 
-    def test_floor_plan(self):
-        text = "Floor Plan - Level 3 Layout"
-        cls, conf = classify_page(text, page_num=5, total_pages=50)
-        assert cls == "FLOOR_PLAN"
-        assert conf >= 0.4
-
-    def test_elevation(self):
-        text = "Interior Elevation - Master Bath"
-        cls, conf = classify_page(text, page_num=10, total_pages=50)
-        assert cls == "ELEVATION"
-
-    def test_schedule(self):
-        text = "Glass Schedule - Door Schedule Reference"
-        cls, conf = classify_page(text, page_num=15, total_pages=50)
-        assert cls == "SCHEDULE"
-
-    def test_detail(self):
-        text = "Typical Detail - Shower Detail SD-5 Enlarged"
-        cls, conf = classify_page(text, page_num=20, total_pages=50)
-        assert cls == "DETAIL"
-
-    def test_notes(self):
-        text = "General Notes and Specifications"
-        cls, conf = classify_page(text, page_num=25, total_pages=50)
-        assert cls == "NOTES"
-
     def test_irrelevant_page(self):
         # Pure noise text with no matching classification keywords
         text = "This page is intentionally blank for printing purposes"
@@ -67,37 +68,10 @@ class TestClassifyPage:
         cls, conf = classify_page(text, page_num=5, total_pages=50)
         assert conf <= 0.95
 
-    def test_low_score_falls_to_irrelevant(self):
-        text = "Page intentionally left blank"
-        cls, conf = classify_page(text, page_num=40, total_pages=50)
-        assert cls == "IRRELEVANT"
-
 
 class TestDetectRelevance:
     """Test detect_relevance keyword matching."""
 
-    def test_shower_keywords(self):
-        relevant = detect_relevance("Frameless shower enclosure detail")
-        assert "showers" in relevant
-
-    def test_mirror_keywords(self):
-        relevant = detect_relevance("Vanity mirror specification")
-        assert "mirrors" in relevant
-
-    def test_assumptions_keywords(self):
-        relevant = detect_relevance("General notes and assumptions section")
-        assert "assumptions" in relevant
-
-    def test_multiple_categories(self):
-        relevant = detect_relevance("Shower enclosure and vanity mirror schedule with assumptions")
-        assert "showers" in relevant
-        assert "mirrors" in relevant
-        assert "assumptions" in relevant
-
-    def test_no_matches(self):
-        relevant = detect_relevance("HVAC ductwork riser diagram")
-        assert relevant == []
-
-    def test_case_insensitive(self):
-        relevant = detect_relevance("SHOWER ENCLOSURE SPECIFICATION")
-        assert "showers" in relevant
+    @pytest.mark.parametrize("text,expected", RELEVANCE_CASES)
+    def test_relevance(self, text, expected):
+        assert set(detect_relevance(text)) == expected
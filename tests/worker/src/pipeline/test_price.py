@@ -1,7 +1,13 @@
 """Tests for pricing logic (worker/src/pipeline/price.py)."""
 
 import pytest
-from src.pipeline.price import _evaluate_formula, _rule_applies, _compute_breakdown
+from src.pipeline.price import (
+    _evaluate_formula,
+    _rule_applies,
+    _compute_breakdown,
+    _compute_breakdown_batch,
+    run_pricing,
+)
 
 
 class TestEvaluateFormula:
@@ -112,3 +118,43 @@ class TestComputeBreakdown:
         breakdown = _compute_breakdown(item, 0.0, [])
         assert breakdown["glass"] == 0.0
         assert breakdown["labor"] == 0.0
+
+    def test_batch_matches_scalar(self):
+        categories = ("SHOWER_ENCLOSURE", "VANITY_MIRROR", "UNKNOWN")
+        items = [{"category": categories[i % 3]} for i in range(10_000)]
+        prices = [i * 1.37 for i in range(10_000)]
+        expected = [_compute_breakdown(item, price, []) for item, price in zip(items, prices)]
+        assert _compute_breakdown_batch(items, prices) == expected
+
+
+class TestRunPricing:
+    """Test line-item assembly in run_pricing with the database stubbed out."""
+
+    def test_breakdowns_batched_and_overrides_kept(self, monkeypatch):
+        override = {
+            "itemId": "item-2", "description": "Custom", "unitPrice": 999.0, "quantity": 1,
+            "totalPrice": 999.0, "breakdown": {"glass": 1.0}, "manualOverride": True,
+            "overrideReason": "negotiated",
+        }
+        ssot = {
+            "items": [
+                {"itemId": "item-1", "category": "SHOWER_ENCLOSURE", "quantityPerUnit": 2},
+                {"itemId": "item-2", "category": "SHOWER_ENCLOSURE"},
+                {"itemId": "item-3", "category": "VANITY_MIRROR"},
+            ],
+            "pricing": {"lineItems": [override]},
+        }
+        rules = [{"id": "r1", "name": "flat", "category": None, "applies_to": None,
+                  "formula_json": {"type": "unit_price", "unitPrice": 1000.0}}]
+        calls = []
+        monkeypatch.setattr("src.pipeline.price._get_active_pricebook", lambda: ({"id": "pb", "version": 1}, rules))
+        monkeypatch.setattr("src.pipeline.price.update_job_status", lambda *a, **kw: calls.append(kw))
+
+        run_pricing({"id": "job-1", "ssot": ssot})
+
+        lines = calls[-1]["ssot"]["pricing"]["lineItems"]
+        assert [li["itemId"] for li in lines] == ["item-1", "item-2", "item-3"]
+        assert lines[0]["breakdown"] == {"glass": 400.0, "hardware": 250.0, "labor": 300.0, "other": 50.0}
+        assert lines[1] is override
+        assert lines[2]["breakdown"] == {"glass": 550.0, "hardware": 100.0, "labor": 250.0, "other": 100.0}
+        assert calls[-1]["ssot"]["pricing"]["total"] == 2000.0 + 999.0 + 1000.0
@@ -0,0 +1,191 @@
+"""Unit tests for worker/src/db.py helpers that need no database."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from src import db
+
+
+class _ScriptedWakeup:
+    """Event stand-in: each wait() runs the next scripted step, then stops the loop."""
+
+    class Stop(Exception):
+        pass
+
+    def __init__(self, *steps):
+        self.steps = list(steps)
+
+    def wait(self, timeout=None):
+        if not self.steps:
+            raise self.Stop
+        self.steps.pop(0)()
+
+    def clear(self):
+        pass
+
+
+@pytest.fixture
+def heartbeat(monkeypatch):
+    """Fresh heartbeat state with _write_heartbeat recording its snapshots."""
+    written = []
+    monkeypatch.setattr(db, "_heartbeat", {"snapshot": None, "seq": 0})
+    monkeypatch.setattr(db, "_heartbeat_thread", None)
+    monkeypatch.setattr(db, "_write_heartbeat", lambda **snapshot: written.append(snapshot))
+    return written
+
+
+def _run_loop(*steps):
+    with pytest.raises(_ScriptedWakeup.Stop):
+        db._heartbeat_loop(_ScriptedWakeup(*steps))
+
+
+class TestHeartbeatLoop:
+    """Test the background heartbeat writer."""
+
+    def test_writes_inline_before_loop_starts(self, heartbeat):
+        db.upsert_heartbeat("w1", "IDLE")
+        assert [h["status"] for h in heartbeat] == ["IDLE"]
+
+    def test_each_snapshot_written_once(self, heartbeat, monkeypatch):
+        monkeypatch.setattr(db, "_heartbeat_thread", object())
+        _run_loop(
+            lambda: db.upsert_heartbeat("w1", "IDLE"),
+            lambda: None,  # interval elapses, no new snapshot
+            lambda: None,
+            lambda: db.upsert_heartbeat("w1", "PROCESSING", "job-1"),
+        )
+        assert [(h["status"], h["current_job_id"]) for h in heartbeat] == [
+            ("IDLE", None), ("PROCESSING", "job-1"),
+        ]
+
+    def test_stalled_main_loop_stops_refreshing(self, heartbeat, monkeypatch):
+        monkeypatch.setattr(db, "_heartbeat_thread", object())
+        _run_loop(lambda: db.upsert_heartbeat("w1", "IDLE"), *[lambda: None] * 5)
+        assert len(heartbeat) == 1
+
+    def test_failed_write_is_retried(self, heartbeat, monkeypatch):
+        monkeypatch.setattr(db, "_heartbeat_thread", object())
+        calls = []
+
+        def flaky(**snapshot):
+            calls.append(snapshot)
+            if len(calls) == 1:
+                raise RuntimeError("db down")
+
+        monkeypatch.setattr(db, "_write_heartbeat", flaky)
+        _run_loop(lambda: db.upsert_heartbeat("w1", "IDLE"), lambda: None, lambda: None)
+        assert len(calls) == 2
+
+    def test_status_change_wakes_writer(self, heartbeat, monkeypatch):
+        monkeypatch.setattr(db, "_heartbeat_thread", object())
+        db._heartbeat_wakeup.clear()
+        db.upsert_heartbeat("w1", "IDLE")
+        db._heartbeat_wakeup.clear()
+        db.upsert_heartbeat("w1", "IDLE", memory_usage_mb=10.0)
+        assert not db._heartbeat_wakeup.is_set()
+        db.upsert_heartbeat("w1", "PROCESSING", "job-1")
+        assert db._heartbeat_wakeup.is_set()
+        db._heartbeat_wakeup.clear()
+
+
+class TestToPositional:
+    """Test the %s -> $n rewrite used for PREPARE."""
+
+    @pytest.mark.parametrize("sql,expected", [
+        pytest.param(
+            "UPDATE jobs SET status = %s WHERE id = %s",
+            "UPDATE jobs SET status = $1 WHERE id = $2",
+            id="placeholders",
+        ),
+        pytest.param(
+            "SET retry_delay = %s::float8 * 2 WHERE id = %s::uuid",
+            "SET retry_delay = $1::float8 * 2 WHERE id = $2::uuid",
+            id="casts",
+        ),
+        pytest.param(
+            "WHERE key LIKE 'page-%%' AND note <> '100%%s' AND id = %s",
+            "WHERE key LIKE 'page-%' AND note <> '100%s' AND id = $1",
+            id="escaped-percent-in-literals",
+        ),
+        pytest.param("SELECT 1", "SELECT 1", id="no-placeholders"),
+    ])
+    def test_rewrite(self, sql, expected):
+        assert db._to_positional(sql) == expected
+
+
+class _FakeConn:
+    def __init__(self):
+        self.prepared = set()
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.connection, self.executed = conn, []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+
+class TestExecutePrepared:
+    """Test prepare-once-per-connection."""
+
+    SQL = "UPDATE jobs SET status = %s WHERE id = %s"
+
+    def test_prepares_once_per_connection(self):
+        conn = _FakeConn()
+        cur = _FakeCursor(conn)
+        db._execute_prepared(cur, "set_status", self.SQL, ("DONE", "job-1"))
+        db._execute_prepared(cur, "set_status", self.SQL, ("FAILED", "job-2"))
+
+        assert cur.executed == [
+            ("PREPARE set_status AS UPDATE jobs SET status = $1 WHERE id = $2", None),
+            ("EXECUTE set_status (%s, %s)", ("DONE", "job-1")),
+            ("EXECUTE set_status (%s, %s)", ("FAILED", "job-2")),
+        ]
+        assert conn.prepared == {"set_status"}
+
+    def test_each_connection_prepares_its_own(self):
+        first, second = _FakeCursor(_FakeConn()), _FakeCursor(_FakeConn())
+        db._execute_prepared(first, "set_status", self.SQL, ("DONE", "job-1"))
+        db._execute_prepared(second, "set_status", self.SQL, ("DONE", "job-2"))
+
+        for cur in (first, second):
+            assert [sql.split()[0] for sql, _ in cur.executed] == ["PREPARE", "EXECUTE"]
+
+
+class TestPooledCursor:
+    """Test that get_cursor hands connections back and drops broken ones."""
+
+    @pytest.fixture
+    def pool(self, monkeypatch):
+        conn = MagicMock(closed=0)
+        pool = MagicMock()
+        pool.getconn.return_value = conn
+        monkeypatch.setattr(db, "_get_pool", lambda: pool)
+        return pool
+
+    def test_connection_returned_to_pool(self, pool):
+        with db.get_cursor(autocommit=True) as (cur, conn):
+            assert conn.autocommit is True
+        pool.putconn.assert_called_once_with(conn, close=False)
+
+    def test_broken_connection_discarded(self, pool):
+        with pytest.raises(db.psycopg2.OperationalError):
+            with db.get_cursor() as (cur, conn):
+                raise db.psycopg2.OperationalError("server closed the connection")
+        pool.putconn.assert_called_once_with(conn, close=True)
+
+    def test_query_error_keeps_connection(self, pool):
+        with pytest.raises(ValueError):
+            with db.get_cursor() as (cur, conn):
+                raise ValueError("bad row")
+        pool.putconn.assert_called_once_with(conn, close=False)
+
+    def test_closed_connection_discarded_on_release(self, pool):
+        conn = pool.getconn.return_value
+        conn.closed = 2
+        db.release_connection(conn)
+        pool.putconn.assert_called_once_with(conn, close=True)
@@ -2,22 +2,42 @@
 
 import os
 import shutil
+import threading
 from unittest.mock import patch, MagicMock
 
 import pytest
 from src.disk import get_disk_usage_pct, is_disk_pressure, cleanup_orphan_temp_dirs, cleanup_job_temp
 
 
+@pytest.fixture(autouse=True)
+def _fresh_disk_usage():
+    """Each test reads disk usage through its own patches, not the TTL cache."""
+    get_disk_usage_pct.cache_clear()
+    yield
+    get_disk_usage_pct.cache_clear()
+
+
 class TestGetDiskUsagePct:
     """Test disk usage reading."""
 
-    @patch("src.disk.shutil.disk_usage")
+    @patch("src.disk.os.statvfs")
     def test_normal_reading(self, mock_usage):
-        mock_usage.return_value = MagicMock(total=100_000_000, used=50_000_000)
+        mock_usage.return_value = MagicMock(f_blocks=100_000, f_bfree=50_000)
         pct = get_disk_usage_pct()
         assert pct == 50.0
 
-    @patch("src.disk.shutil.disk_usage")
+    @patch("src.disk.os.statvfs")
+    def test_reading_cached_within_ttl(self, mock_usage):
+        mock_usage.return_value = MagicMock(f_blocks=100_000, f_bfree=50_000)
+        assert get_disk_usage_pct() == 50.0
+        mock_usage.return_value = MagicMock(f_blocks=100_000, f_bfree=10_000)
+        assert get_disk_usage_pct() == 50.0
+        assert mock_usage.call_count == 1
+
+        get_disk_usage_pct.cache_clear()
+        assert get_disk_usage_pct() == 90.0
+
+    @patch("src.disk.os.statvfs")
     def test_exception_returns_zero(self, mock_usage):
         mock_usage.side_effect = OSError("no such volume")
         pct = get_disk_usage_pct()
@@ -63,6 +83,34 @@ class TestCleanupOrphanTempDirs:
         assert not orphan_dir.exists()
         assert locked_dir.exists()
 
+    @pytest.mark.parametrize("use_rm", [
+        pytest.param(True, id="coreutils-rm"),
+        pytest.param(False, id="shutil-fallback"),
+    ])
+    def test_many_orphans_cleaned(self, use_rm, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.disk.config.TEMP_DIR", str(tmp_path))
+        if not use_rm:
+            monkeypatch.setattr("src.disk._RM", None)
+
+        for i in range(5):
+            job_dir = tmp_path / f"orphan-{i}"
+            job_dir.mkdir()
+            (job_dir / "source.pdf").touch()
+        (tmp_path / "locked-job").mkdir()
+
+        cleanup_orphan_temp_dirs({"locked-job"})
+
+        assert [p.name for p in tmp_path.iterdir()] == ["locked-job"]
+
+    def test_locked_ids_as_list(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.disk.config.TEMP_DIR", str(tmp_path))
+        (tmp_path / "orphan").mkdir()
+        (tmp_path / "locked-job").mkdir()
+
+        cleanup_orphan_temp_dirs(["locked-job"])
+
+        assert [p.name for p in tmp_path.iterdir()] == ["locked-job"]
+
     def test_missing_temp_dir_created(self, tmp_path, monkeypatch):
         new_dir = tmp_path / "nonexistent"
         monkeypatch.setattr("src.disk.config.TEMP_DIR", str(new_dir))
@@ -82,6 +130,43 @@ class TestCleanupJobTemp:
         cleanup_job_temp("job-789")
         assert not job_dir.exists()
 
+    @pytest.fixture
+    def idle_janitor(self, tmp_path, monkeypatch):
+        from src import disk
+
+        monkeypatch.setattr("src.disk.config.TEMP_DIR", str(tmp_path))
+        # Keep any janitor started by earlier tests asleep
+        monkeypatch.setattr(disk, "_ensure_janitor", lambda: None)
+        monkeypatch.setattr(disk, "_trash_wakeup", threading.Event())
+        return tmp_path / disk.TRASH_DIRNAME
+
+    def test_trash_drained_by_janitor(self, tmp_path, idle_janitor):
+        from src import disk
+
+        job_dir = tmp_path / "job-789"
+        job_dir.mkdir()
+        (job_dir / "file.txt").touch()
+
+        cleanup_job_temp("job-789")
+        assert not job_dir.exists()
+        assert len(list(idle_janitor.iterdir())) == 1
+
+        disk._drain_trash()
+        assert list(idle_janitor.iterdir()) == []
+
+    def test_leftover_trash_drained_at_startup(self, tmp_path, idle_janitor):
+        # Trash a previous process moved aside but never deleted
+        for i in range(3):
+            leftover = idle_janitor / f"job-{i}-dead"
+            leftover.mkdir(parents=True)
+            (leftover / "file.txt").touch()
+        (tmp_path / "locked-job").mkdir()
+
+        cleanup_orphan_temp_dirs({"locked-job"})
+
+        assert list(idle_janitor.iterdir()) == []
+        assert sorted(p.name for p in tmp_path.iterdir()) == [idle_janitor.name, "locked-job"]
+
     def test_nonexistent_dir_no_error(self, tmp_path, monkeypatch):
         monkeypatch.setattr("src.disk.config.TEMP_DIR", str(tmp_path))
         cleanup_job_temp("nonexistent-job")
@@ -6,9 +6,13 @@ Also handles stale uploads, orphan temp dirs, and disk pressure emergency cleanu
 
 import os
 import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+import psycopg2.extensions
 import structlog
+from minio.deleteobjects import DeleteObject
 
 from . import config
 from .db import get_cursor
@@ -16,6 +20,49 @@ from .storage import get_client
 
 logger = structlog.get_logger()
 
+# Prepended to a statement before each cleanup transaction takes locks, so it
+# costs no extra round trip: give up on contended locks quickly instead of
+# stalling writers, and never sit idle holding them.
+_TXN_TIMEOUTS = (
+    "SET LOCAL lock_timeout = '1s';"
+    " SET LOCAL idle_in_transaction_session_timeout = '30s';"
+)
+
+
+def _remove_minio_objects(client, objects) -> None:
+    """Delete ``(bucket, key)`` pairs with one multi-object request per bucket.
+
+    Failures are logged, never raised: the DB rows are dropped either way.
+    """
+    by_bucket = defaultdict(list)
+    for bucket, key in objects:
+        by_bucket[bucket].append(DeleteObject(key))
+
+    def remove_bucket(bucket, delete_list):
+        try:
+            # remove_objects is lazy and batches 1000 keys per request;
+            # consuming it sends the requests and yields per-key errors.
+            for err in client.remove_objects(bucket, delete_list):
+                logger.warning(
+                    "Failed to delete MinIO object",
+                    bucket=bucket, key=err.name, error=err.message,
+                )
+        except Exception as e:
+            logger.warning(
+                "Failed to delete MinIO objects",
+                bucket=bucket, count=len(delete_list), error=str(e),
+            )
+
+    if len(by_bucket) <= 1 or config.CLEANUP_PARALLELISM <= 1:
+        for bucket, delete_list in by_bucket.items():
+            remove_bucket(bucket, delete_list)
+        return
+
+    # Buckets are independent HTTP round-trips, so overlap them.
+    workers = min(config.CLEANUP_PARALLELISM, len(by_bucket))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(remove_bucket, by_bucket.keys(), by_bucket.values()))
+
 
 def cleanup_expired_storage_objects() -> int:
     """Delete expired storage objects from MinIO and the DB.
@@ -26,28 +73,27 @@ def cleanup_expired_storage_objects() -> int:
     client = get_client()
 
     try:
-        with get_cursor() as (cur, conn):
+        with get_cursor(cursor_factory=psycopg2.extensions.cursor) as (cur, conn):
+            # One round-trip drops the rows and returns what MinIO still holds.
             cur.execute(
-                """
-                SELECT id, bucket, key, job_id
-                FROM storage_objects
-                WHERE expires_at IS NOT NULL AND expires_at < NOW()
-                LIMIT 500
+                _TXN_TIMEOUTS + """
+                WITH victims AS (
+                    SELECT id FROM storage_objects
+                    WHERE expires_at IS NOT NULL AND expires_at < NOW()
+                    ORDER BY expires_at
+                    LIMIT 500
+                    FOR UPDATE SKIP LOCKED
+                )
+                DELETE FROM storage_objects
+                WHERE id IN (SELECT id FROM victims)
+                RETURNING id, bucket, key, job_id
                 """
             )
             expired = cur.fetchall()
 
-            for obj in expired:
-                try:
-                    client.remove_object(obj["bucket"], obj["key"])
-                except Exception as e:
-                    logger.warning(
-                        "Failed to delete MinIO object",
-                        bucket=obj["bucket"], key=obj["key"], error=str(e),
-                    )
-
-                cur.execute("DELETE FROM storage_objects WHERE id = %s", (obj["id"],))
-                count += 1
+            # Runs before commit, so a crash here leaves the rows for the next pass.
+            _remove_minio_objects(client, ((bucket, key) for _, bucket, key, _ in expired))
+            count = len(expired)
 
             conn.commit()
 
@@ -68,41 +114,55 @@ def cleanup_stale_uploads() -> int:
     client = get_client()
 
     try:
-        with get_cursor() as (cur, conn):
+        with get_cursor(cursor_factory=psycopg2.extensions.cursor) as (cur, conn):
+            # Cheap probe first: in steady state nothing is stale and the
+            # join below never runs.
             cur.execute(
-                """
-                SELECT j.id AS job_id, j.project_id, so.id AS so_id, so.bucket, so.key
-                FROM jobs j
-                LEFT JOIN storage_objects so ON so.job_id = j.id
-                WHERE j.status IN ('CREATED', 'UPLOADING')
-                  AND j.created_at < NOW() - INTERVAL '24 hours'
-                LIMIT 100
+                _TXN_TIMEOUTS + """
+                SELECT 1 FROM jobs
+                WHERE status IN ('CREATED', 'UPLOADING')
+                  AND created_at < NOW() - INTERVAL '24 hours'
+                LIMIT 1
                 """
             )
-            stale = cur.fetchall()
+            stale = []
+            if cur.fetchone() is not None:
+                cur.execute(
+                    """
+                    SELECT j.id AS job_id, j.project_id, so.id AS so_id, so.bucket, so.key
+                    FROM jobs j
+                    LEFT JOIN storage_objects so ON so.job_id = j.id
+                    WHERE j.status IN ('CREATED', 'UPLOADING')
+                      AND j.created_at < NOW() - INTERVAL '24 hours'
+                    LIMIT 100
+                    """
+                )
+                stale = cur.fetchall()
 
-            for row in stale:
-                # Delete MinIO object if exists
-                if row.get("bucket") and row.get("key"):
-                    try:
-                        client.remove_object(row["bucket"], row["key"])
-                    except Exception:
-                        pass
+            # Rows are (job_id, project_id, so_id, bucket, key); the storage
+            # columns are NULL for jobs that never got an object.
+            stored = [row for row in stale if row[3] and row[4]]
 
-                    cur.execute("DELETE FROM storage_objects WHERE id = %s", (row["so_id"],))
+            # Delete MinIO objects if they exist
+            _remove_minio_objects(client, ((row[3], row[4]) for row in stored))
 
-                # Mark job as FAILED
+            if stale:
+                # Drop the storage rows and fail the jobs in one statement
+                so_ids = [row[2] for row in stored]
                 cur.execute(
                     """
+                    WITH dropped AS (
+                        DELETE FROM storage_objects WHERE id = ANY(%s)
+                    )
                     UPDATE jobs
                     SET status = 'FAILED',
                         error_code = 'UPLOAD_ABANDONED',
                         error_message = 'Upload abandoned after 24h of inactivity'
-                    WHERE id = %s
+                    WHERE id = ANY(%s)
                     """,
-                    (row["job_id"],),
+                    (so_ids, list(dict.fromkeys(row[0] for row in stale))),
                 )
-                count += 1
+                count = len(stale)
 
             conn.commit()
 
@@ -121,10 +181,10 @@ def cleanup_old_ssot_and_audit() -> int:
     """
     count = 0
     try:
-        with get_cursor() as (cur, conn):
+        with get_cursor(cursor_factory=psycopg2.extensions.cursor) as (cur, conn):
             # Clear SSOT for old completed jobs
             cur.execute(
-                """
+                _TXN_TIMEOUTS + """
                 UPDATE jobs
                 SET ssot = '{}'
                 WHERE status = 'DONE'
@@ -160,24 +220,27 @@ def emergency_page_cache_cleanup() -> int:
     client = get_client()
 
     try:
-        with get_cursor() as (cur, conn):
+        with get_cursor(cursor_factory=psycopg2.extensions.cursor) as (cur, conn):
+            # A couple hundred plain tuples: one fetchall() round trip is
+            # cheaper than a server-side cursor's DECLARE/FETCH/CLOSE.
+            # Served oldest-first by idx_storage_objects_bucket_created.
             cur.execute(
-                """
+                _TXN_TIMEOUTS + """
                 SELECT id, bucket, key FROM storage_objects
                 WHERE bucket = 'page-cache'
                 ORDER BY created_at ASC
                 LIMIT 200
                 """
             )
-            objects = cur.fetchall()
-
-            for obj in objects:
-                try:
-                    client.remove_object(obj["bucket"], obj["key"])
-                except Exception:
-                    pass
-                cur.execute("DELETE FROM storage_objects WHERE id = %s", (obj["id"],))
-                count += 1
+            victims = cur.fetchall()
+            ids = [so_id for so_id, _, _ in victims]
+            keys = [(bucket, key) for _, bucket, key in victims]
+
+            _remove_minio_objects(client, keys)
+
+            if ids:
+                cur.execute("DELETE FROM storage_objects WHERE id = ANY(%s)", (ids,))
+                count = len(ids)
 
             conn.commit()
     except Exception as e:
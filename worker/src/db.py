@@ -4,13 +4,19 @@ The worker uses Postgres as its job queue via FOR UPDATE SKIP LOCKED.
 Prisma Migrate owns the schema; the worker reads/writes via SQL only.
 """
 
+import atexit
 import json
 import contextlib
+import itertools
+import re
+import threading
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 import psycopg2
+import psycopg2.extensions
 import psycopg2.extras
+import psycopg2.pool
 import structlog
 
 from . import config
@@ -20,21 +26,104 @@ logger = structlog.get_logger()
 psycopg2.extras.register_uuid()
 
 
+_pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+# Latest heartbeat snapshot, flushed by the background heartbeat thread.
+# ``seq`` counts snapshots handed over by upsert_heartbeat(); the writer
+# thread only writes when it has moved on, so a stalled main loop stops
+# refreshing last_heartbeat_at instead of replaying an old snapshot.
+_heartbeat = {"snapshot": None, "seq": 0}
+_heartbeat_lock = threading.Lock()
+_heartbeat_wakeup = threading.Event()
+_heartbeat_thread: Optional[threading.Thread] = None
+
+# Errors after which a connection cannot be trusted back in the pool.
+_BROKEN_CONNECTION_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+
+
+class _Connection(psycopg2.extensions.connection):
+    """Pooled connection that remembers which statements it has PREPAREd."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: set[str] = set()
+
+
+def _get_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """Create the process-wide pool on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = psycopg2.pool.ThreadedConnectionPool(
+                    minconn=1, maxconn=config.DB_POOL_MAX_CONN, dsn=config.DATABASE_URL,
+                    connection_factory=_Connection,
+                )
+                atexit.register(_pool.closeall)
+    return _pool
+
+
 def get_connection():
-    """Create a new database connection."""
-    return psycopg2.connect(config.DATABASE_URL)
+    """Borrow a connection from the pool; hand it back with release_connection."""
+    return _get_pool().getconn()
+
+
+def release_connection(conn, *, close: bool = False) -> None:
+    """Return a pooled connection, discarding it if closed or broken.
+
+    The pool rolls back any transaction still open on the connection.
+    """
+    _get_pool().putconn(conn, close=close or bool(conn.closed))
 
 
 @contextlib.contextmanager
-def get_cursor(autocommit: bool = False):
-    """Context manager for DB cursor with auto-close."""
+def get_cursor(autocommit: bool = False, cursor_factory=psycopg2.extras.RealDictCursor):
+    """Context manager for DB cursor; returns the connection to the pool.
+
+    Rows are dicts by default; pass ``cursor_factory=psycopg2.extensions.cursor``
+    for plain tuples where per-row dicts are not worth building.
+    """
     conn = get_connection()
-    conn.autocommit = autocommit
+    broken = False
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        conn.autocommit = autocommit
+        with conn.cursor(cursor_factory=cursor_factory) as cur:
             yield cur, conn
+    except _BROKEN_CONNECTION_ERRORS:
+        broken = True
+        raise
     finally:
-        conn.close()
+        release_connection(conn, close=broken)
+
+
+_PYFORMAT_TOKEN = re.compile(r"%%|%s")
+
+
+def _to_positional(sql: str) -> str:
+    """Rewrite ``%s`` placeholders as ``$1, $2, ...`` for PREPARE.
+
+    PREPARE goes out without parameters, so psycopg2 does no ``%``
+    processing on it; ``%%`` escapes are unescaped here instead.
+    """
+    counter = itertools.count(1)
+    return _PYFORMAT_TOKEN.sub(
+        lambda m: "%" if m.group() == "%%" else f"${next(counter)}", sql,
+    )
+
+
+def _execute_prepared(cur, name: str, sql: str, params) -> None:
+    """Run ``sql`` as a named server-side prepared statement.
+
+    ``sql`` uses the usual ``%s`` placeholders. It is PREPAREd once per
+    pooled connection and then run with EXECUTE, so repeat calls skip
+    Postgres's parse and plan steps.
+    """
+    conn = cur.connection
+    if name not in conn.prepared:
+        cur.execute(f"PREPARE {name} AS {_to_positional(sql)}")
+        conn.prepared.add(name)
+    cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
 
 
 # ─── Job Queue ───────────────────────────────────────────────────────────────
@@ -43,51 +132,49 @@ def get_cursor(autocommit: bool = False):
 def claim_main_job(worker_id: str) -> Optional[dict]:
     """Claim the next available main job using FOR UPDATE SKIP LOCKED.
 
+    The row is selected and locked in a single UPDATE ... RETURNING, so a
+    claim costs one round trip and runs as its own autocommit statement.
+
     Returns the job row dict or None if no job available.
     """
     conn = get_connection()
+    broken = False
     try:
-        conn.autocommit = False
+        conn.autocommit = True
         with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            cur.execute(
-                """
-                SELECT id, project_id, status, ssot, stage_progress,
-                       retry_count, max_retries
-                FROM jobs
-                WHERE status IN ('UPLOADED', 'EXTRACTED', 'REVIEWED', 'PRICED')
-                  AND (locked_at IS NULL
-                       OR locked_at < NOW() - INTERVAL '10 minutes')
-                  AND (next_run_at IS NULL OR next_run_at <= NOW())
-                ORDER BY created_at
-                FOR UPDATE SKIP LOCKED
-                LIMIT 1
-                """
-            )
-            row = cur.fetchone()
-            if not row:
-                conn.rollback()
-                return None
-
             cur.execute(
                 """
                 UPDATE jobs
                 SET locked_at = NOW(), locked_by = %s
-                WHERE id = %s
+                WHERE id = (
+                    SELECT id
+                    FROM jobs
+                    WHERE status IN ('UPLOADED', 'EXTRACTED', 'REVIEWED', 'PRICED')
+                      AND (locked_at IS NULL
+                           OR locked_at < NOW() - INTERVAL '10 minutes')
+                      AND (next_run_at IS NULL OR next_run_at <= NOW())
+                    ORDER BY created_at
+                    FOR UPDATE SKIP LOCKED
+                    LIMIT 1
+                )
+                RETURNING id, project_id, status, ssot, stage_progress,
+                          retry_count, max_retries
                 """,
-                (worker_id, row["id"]),
+                (worker_id,),
             )
-            conn.commit()
-            return dict(row)
-    except Exception:
-        conn.rollback()
+            row = cur.fetchone()
+            return dict(row) if row else None
+    except _BROKEN_CONNECTION_ERRORS:
+        broken = True
         raise
     finally:
-        conn.close()
+        release_connection(conn, close=broken)
 
 
 def claim_render_request(worker_id: str) -> Optional[dict]:
     """Claim the next pending render request (MEASURE first, then THUMB)."""
     conn = get_connection()
+    broken = False
     try:
         conn.autocommit = False
         with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
@@ -110,11 +197,14 @@ def claim_render_request(worker_id: str) -> Optional[dict]:
 
             conn.commit()
             return dict(row)
+    except _BROKEN_CONNECTION_ERRORS:
+        broken = True
+        raise
     except Exception:
         conn.rollback()
         raise
     finally:
-        conn.close()
+        release_connection(conn, close=broken)
 
 
 # ─── Job Status Updates ──────────────────────────────────────────────────────
@@ -130,33 +220,44 @@ def update_job_status(
     clear_lock: bool = True,
     ssot: Optional[dict] = None,
 ) -> None:
-    """Update a job's status and optionally its SSOT, progress, or error info."""
+    """Update a job's status and optionally its SSOT, progress, or error info.
+
+    Each combination of optional fields gets its own prepared statement.
+    """
     with get_cursor() as (cur, conn):
         fields = ["status = %s", "updated_at = NOW()"]
         params: list[Any] = [new_status]
+        mask = 0
 
         if clear_lock:
             fields.append("locked_at = NULL")
             fields.append("locked_by = NULL")
+            mask |= 1
 
         if stage_progress is not None:
             fields.append("stage_progress = %s")
             params.append(json.dumps(stage_progress))
+            mask |= 2
 
         if error_message is not None:
             fields.append("error_message = %s")
             params.append(error_message)
+            mask |= 4
 
         if error_code is not None:
             fields.append("error_code = %s")
             params.append(error_code)
+            mask |= 8
 
         if ssot is not None:
             fields.append("ssot = %s")
             params.append(json.dumps(ssot))
+            mask |= 16
 
         params.append(job_id)
-        cur.execute(
+        _execute_prepared(
+            cur,
+            f"update_job_status_{mask}",
             f"UPDATE jobs SET {', '.join(fields)} WHERE id = %s",
             params,
         )
@@ -178,11 +279,13 @@ def mark_job_failed(
 def increment_retry(job_id: str, backoff_seconds: int) -> None:
     """Increment retry count and set next_run_at for backoff."""
     with get_cursor() as (cur, conn):
-        cur.execute(
+        _execute_prepared(
+            cur,
+            "increment_retry",
             """
             UPDATE jobs
             SET retry_count = retry_count + 1,
-                next_run_at = NOW() + %s * INTERVAL '1 second',
+                next_run_at = NOW() + %s::float8 * INTERVAL '1 second',
                 locked_at = NULL,
                 locked_by = NULL
             WHERE id = %s
@@ -198,7 +301,9 @@ def increment_retry(job_id: str, backoff_seconds: int) -> None:
 def complete_render_request(request_id: str, output_key: str) -> None:
     """Mark a render request as DONE with the output MinIO key."""
     with get_cursor() as (cur, conn):
-        cur.execute(
+        _execute_prepared(
+            cur,
+            "complete_render_request",
             """
             UPDATE render_requests
             SET status = 'DONE', output_key = %s, completed_at = NOW()
@@ -212,7 +317,9 @@ def complete_render_request(request_id: str, output_key: str) -> None:
 def fail_render_request(request_id: str) -> None:
     """Mark a render request as FAILED."""
     with get_cursor() as (cur, conn):
-        cur.execute(
+        _execute_prepared(
+            cur,
+            "fail_render_request",
             """
             UPDATE render_requests
             SET status = 'FAILED', completed_at = NOW()
@@ -278,16 +385,18 @@ def cap_pending_thumbs_per_job(max_pending: int = 20) -> int:
 # ─── Worker Heartbeat ────────────────────────────────────────────────────────
 
 
-def upsert_heartbeat(
+def _write_heartbeat(
     worker_id: str,
-    status: str = "IDLE",
-    current_job_id: Optional[str] = None,
-    memory_usage_mb: Optional[float] = None,
-    disk_usage_pct: Optional[float] = None,
+    status: str,
+    current_job_id: Optional[str],
+    memory_usage_mb: Optional[float],
+    disk_usage_pct: Optional[float],
 ) -> None:
     """Upsert the worker heartbeat row."""
     with get_cursor() as (cur, conn):
-        cur.execute(
+        _execute_prepared(
+            cur,
+            "upsert_heartbeat",
             """
             INSERT INTO worker_heartbeats
                 (worker_id, last_heartbeat_at, status, current_job_id,
@@ -304,3 +413,67 @@ def upsert_heartbeat(
             (worker_id, status, current_job_id, memory_usage_mb, disk_usage_pct),
         )
         conn.commit()
+
+
+def upsert_heartbeat(
+    worker_id: str,
+    status: str = "IDLE",
+    current_job_id: Optional[str] = None,
+    memory_usage_mb: Optional[float] = None,
+    disk_usage_pct: Optional[float] = None,
+) -> None:
+    """Record the worker heartbeat.
+
+    Once start_heartbeat_loop() is running this only stores the latest
+    snapshot for the background thread to write; a change of status or
+    current job wakes it early. Each snapshot is written at most once, so
+    last_heartbeat_at only advances while the caller keeps reporting.
+    Before the loop starts, the row is written inline.
+    """
+    snapshot = {
+        "worker_id": worker_id,
+        "status": status,
+        "current_job_id": current_job_id,
+        "memory_usage_mb": memory_usage_mb,
+        "disk_usage_pct": disk_usage_pct,
+    }
+    if _heartbeat_thread is None:
+        _write_heartbeat(**snapshot)
+        return
+
+    with _heartbeat_lock:
+        prev = _heartbeat["snapshot"]
+        _heartbeat["snapshot"] = snapshot
+        _heartbeat["seq"] += 1
+    if prev is None or (prev["status"], prev["current_job_id"]) != (status, current_job_id):
+        _heartbeat_wakeup.set()
+
+
+def _heartbeat_loop(wakeup: threading.Event) -> None:
+    written_seq = 0
+    while True:
+        wakeup.wait(config.HEARTBEAT_INTERVAL_SECONDS)
+        wakeup.clear()
+        with _heartbeat_lock:
+            snapshot = _heartbeat["snapshot"]
+            seq = _heartbeat["seq"]
+        if snapshot is None or seq == written_seq:
+            continue
+        try:
+            _write_heartbeat(**snapshot)
+        except Exception as e:
+            logger.warning("Could not write heartbeat", error=str(e))
+        else:
+            written_seq = seq
+
+
+def start_heartbeat_loop() -> None:
+    """Start the heartbeat-writing daemon thread once per process."""
+    global _heartbeat_thread
+    with _heartbeat_lock:
+        if _heartbeat_thread is None or not _heartbeat_thread.is_alive():
+            _heartbeat_thread = threading.Thread(
+                target=_heartbeat_loop, args=(_heartbeat_wakeup,),
+                name="heartbeat", daemon=True,
+            )
+            _heartbeat_thread.start()
@@ -13,7 +13,12 @@ Generates a professional bid document from the SSOT JSON with:
 
 import os
 import io
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from typing import BinaryIO, Optional, Union
+from xml.sax.saxutils import escape
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
@@ -25,6 +30,7 @@ from reportlab.platypus import (
     Paragraph,
     Spacer,
     Table,
+    LongTable,
     TableStyle,
     PageBreak,
     KeepTogether,
@@ -42,9 +48,92 @@ ACCENT = HexColor("#e2e8f0")
 LIGHT_BG = HexColor("#f7fafc")
 BORDER = HexColor("#cbd5e0")
 
-
+# ─── Separators ──────────────────────────────────────────────────────────────
+# Built fresh for every use: platypus marks a flowable postponed when it is
+# pushed to the next frame and never resets the flag, so a shared instance
+# postponed twice raises LayoutError.
+def _section_hr() -> HRFlowable:
+    return HRFlowable(width="100%", thickness=1, color=BORDER)
+
+
+def _cover_hr() -> HRFlowable:
+    return HRFlowable(width="60%", thickness=2, color=PRIMARY)
+
+
+# ─── Table Styles ────────────────────────────────────────────────────────────
+# Shared across generations; none of these depend on the table's contents.
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), PRIMARY),
+    ("TEXTCOLOR", (0, 0), (-1, 0), white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 10),
+    ("ALIGN", (1, 0), (1, -1), "CENTER"),
+    ("GRID", (0, 0), (-1, -1), 0.5, BORDER),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [white, LIGHT_BG]),
+    ("TOPPADDING", (0, 0), (-1, -1), 6),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+])
+
+_SCOPE_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), PRIMARY),
+    ("TEXTCOLOR", (0, 0), (-1, 0), white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("ALIGN", (0, 0), (0, -1), "CENTER"),
+    ("ALIGN", (-1, 0), (-1, -1), "CENTER"),
+    ("GRID", (0, 0), (-1, -1), 0.5, BORDER),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [white, LIGHT_BG]),
+    ("TOPPADDING", (0, 0), (-1, -1), 4),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+])
+
+_PRICING_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), PRIMARY),
+    ("TEXTCOLOR", (0, 0), (-1, 0), white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ("ALIGN", (0, 0), (0, -1), "CENTER"),
+    ("ALIGN", (2, 0), (2, -1), "CENTER"),
+    ("ALIGN", (3, 0), (-1, -1), "RIGHT"),
+    ("TOPPADDING", (0, 0), (-1, -1), 5),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+    ("GRID", (0, 0), (-1, -1), 0.5, BORDER),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [white, LIGHT_BG]),
+])
+
+# Subtotal / tax / TOTAL rows, laid out as their own small table under
+# the line items; the blank first column spans #, Description and Qty.
+_PRICING_TOTALS_COL_WIDTHS = [4.1 * inch, 1.2 * inch, 1.2 * inch]
+_PRICING_TOTALS_STYLE = TableStyle([
+    ("FONTNAME", (1, 0), (-1, -1), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ("ALIGN", (1, 0), (-1, -1), "RIGHT"),
+    ("TOPPADDING", (0, 0), (-1, -1), 5),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+    ("LINEABOVE", (1, 0), (-1, 0), 1, BORDER),
+    ("LINEABOVE", (-2, -1), (-1, -1), 2, PRIMARY),
+    ("FONTSIZE", (-2, -1), (-1, -1), 11),
+])
+
+_ALTERNATES_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), PRIMARY),
+    ("TEXTCOLOR", (0, 0), (-1, 0), white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ("ALIGN", (-1, 0), (-1, -1), "RIGHT"),
+    ("GRID", (0, 0), (-1, -1), 0.5, BORDER),
+    ("TOPPADDING", (0, 0), (-1, -1), 5),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+])
+
+
+@lru_cache(maxsize=1)
 def _get_styles():
-    """Create custom paragraph styles for the bid document."""
+    """Create custom paragraph styles for the bid document.
+
+    Built once per process; callers only read from the returned sheet.
+    """
     styles = getSampleStyleSheet()
 
     styles.add(ParagraphStyle(
@@ -63,6 +152,14 @@ def _get_styles():
         alignment=TA_CENTER,
         spaceAfter=6,
     ))
+    styles.add(ParagraphStyle(
+        name="CoverInfo",
+        fontName="Helvetica",
+        fontSize=11,
+        leading=19,
+        textColor=black,
+        alignment=TA_CENTER,
+    ))
     styles.add(ParagraphStyle(
         name="SectionTitle",
         fontName="Helvetica-Bold",
@@ -118,6 +215,66 @@ def _get_styles():
     return styles
 
 
+# Categories and configurations are small enums; label each value once.
+@lru_cache(maxsize=128)
+def _category_label(category: str) -> str:
+    return category.replace("_", " ").title()
+
+
+@lru_cache(maxsize=128)
+def _configuration_label(configuration: str) -> str:
+    return configuration.replace("-", " ").title()
+
+
+@dataclass(slots=True)
+class NormalizedItem:
+    """One SSOT item, flattened once for the summary and scope sections."""
+
+    unit_id: str
+    category: Optional[str]  # raw enum value; None when absent
+    configuration: str  # display label
+    width: Optional[float]
+    height: Optional[float]
+    tbv: bool
+    glass: str
+    qty: int
+
+
+def _normalize_items(items: list[dict]) -> list[NormalizedItem]:
+    """Resolve the nested ``.get()`` chains for every item in one pass."""
+    rows = []
+    for item in items:
+        dims = item.get("dimensions", {})
+        rows.append(NormalizedItem(
+            unit_id=item.get("unitId") or "General",
+            category=item.get("category"),
+            configuration=_configuration_label(item.get("configuration", "")),
+            width=dims.get("width", {}).get("value"),
+            height=dims.get("height", {}).get("value"),
+            tbv="TO_BE_VERIFIED_IN_FIELD" in item.get("flags", []),
+            glass=item.get("glassType", ""),
+            qty=item.get("quantityPerUnit", 1),
+        ))
+    return rows
+
+
+def _whole_inches(v) -> str:
+    """``f"{v:.0f}"``, skipping float formatting for whole-inch values."""
+    vi = int(v)
+    return str(vi) if vi == v else f"{v:.0f}"
+
+
+def _format_item_dims(w: Optional[float], h: Optional[float]) -> str:
+    """Scope-table dimension text: W x H, W or H alone, or TBV."""
+    if w and h:
+        return f'{_whole_inches(w)}" x {_whole_inches(h)}"'
+    if w:
+        return f'{_whole_inches(w)}" W'
+    if h:
+        return f'{_whole_inches(h)}" H'
+    return "TBV"
+
+
 def _build_cover_page(ssot: dict, styles) -> list:
     """Build the cover page elements."""
     metadata = ssot.get("metadata", {})
@@ -129,7 +286,7 @@ def _build_cover_page(ssot: dict, styles) -> list:
     elements.append(Paragraph("Bid / Breakdown", styles["CoverSubtitle"]))
     elements.append(Spacer(1, 0.5 * inch))
 
-    elements.append(HRFlowable(width="60%", thickness=2, color=PRIMARY))
+    elements.append(_cover_hr())
     elements.append(Spacer(1, 0.3 * inch))
 
     project_name = metadata.get("projectName", "Untitled Project")
@@ -137,25 +294,21 @@ def _build_cover_page(ssot: dict, styles) -> list:
     address = metadata.get("address", "")
     date = metadata.get("updatedAt", datetime.now().isoformat())[:10]
 
-    info_data = [
-        ["Project:", project_name],
-        ["Client:", client_name],
-        ["Address:", address],
-        ["Date:", date],
+    # Four fixed label/value lines; a Paragraph avoids a Table layout pass.
+    info_lines = [
+        ("Project:", project_name),
+        ("Client:", client_name),
+        ("Address:", address),
+        ("Date:", date),
     ]
-
-    info_table = Table(info_data, colWidths=[1.5 * inch, 4 * inch])
-    info_table.setStyle(TableStyle([
-        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-        ("FONTNAME", (1, 0), (1, -1), "Helvetica"),
-        ("FONTSIZE", (0, 0), (-1, -1), 11),
-        ("TEXTCOLOR", (0, 0), (0, -1), SECONDARY),
-        ("ALIGN", (0, 0), (0, -1), "RIGHT"),
-        ("ALIGN", (1, 0), (1, -1), "LEFT"),
-        ("TOPPADDING", (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-    ]))
-    elements.append(info_table)
+    elements.append(Paragraph(
+        "<br/>".join(
+            f'<font name="Helvetica-Bold" color="{SECONDARY.hexval()}">{label}</font>'
+            f"&nbsp;&nbsp;{escape(str(value))}"
+            for label, value in info_lines
+        ),
+        styles["CoverInfo"],
+    ))
 
     elements.append(PageBreak())
     return elements
@@ -184,16 +337,16 @@ def _build_toc(ssot: dict, styles) -> list:
     return elements
 
 
-def _build_executive_summary(ssot: dict, styles) -> list:
+def _build_executive_summary(ssot: dict, rows: list[NormalizedItem], styles) -> list:
     """Build executive summary section."""
     elements = []
     elements.append(Paragraph("1. Executive Summary", styles["SectionTitle"]))
-    elements.append(HRFlowable(width="100%", thickness=1, color=BORDER))
+    elements.append(_section_hr())
     elements.append(Spacer(1, 0.1 * inch))
 
     pricing = ssot.get("pricing", {})
     total = pricing.get("total", 0)
-    items_count = len(ssot.get("items", []))
+    items_count = len(rows)
 
     elements.append(Paragraph(
         f"This proposal covers the supply and installation of frameless glass "
@@ -205,10 +358,9 @@ def _build_executive_summary(ssot: dict, styles) -> list:
     elements.append(Spacer(1, 0.2 * inch))
 
     # Summary table
-    categories = {}
-    for item in ssot.get("items", []):
-        cat = item.get("category", "OTHER").replace("_", " ").title()
-        categories[cat] = categories.get(cat, 0) + item.get("quantityPerUnit", 1)
+    categories = Counter()
+    for row in rows:
+        categories[_category_label("OTHER" if row.category is None else row.category)] += row.qty
 
     if categories:
         summary_data = [["Category", "Quantity"]]
@@ -216,90 +368,50 @@ def _build_executive_summary(ssot: dict, styles) -> list:
             summary_data.append([cat, str(qty)])
 
         t = Table(summary_data, colWidths=[4 * inch, 1.5 * inch])
-        t.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), PRIMARY),
-            ("TEXTCOLOR", (0, 0), (-1, 0), white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 10),
-            ("ALIGN", (1, 0), (1, -1), "CENTER"),
-            ("GRID", (0, 0), (-1, -1), 0.5, BORDER),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [white, LIGHT_BG]),
-            ("TOPPADDING", (0, 0), (-1, -1), 6),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-        ]))
+        t.setStyle(_SUMMARY_TABLE_STYLE)
         elements.append(t)
 
     elements.append(Spacer(1, 0.3 * inch))
     return elements
 
 
-def _build_scope_of_work(ssot: dict, styles) -> list:
+def _build_scope_of_work(ssot: dict, rows: list[NormalizedItem], styles) -> list:
     """Build scope of work section grouped by unit type."""
     elements = []
     elements.append(Paragraph("2. Scope of Work", styles["SectionTitle"]))
-    elements.append(HRFlowable(width="100%", thickness=1, color=BORDER))
+    elements.append(_section_hr())
     elements.append(Spacer(1, 0.1 * inch))
 
-    items = ssot.get("items", [])
-    if not items:
+    if not rows:
         elements.append(Paragraph("No items extracted.", styles["BodyText2"]))
         return elements
 
     # Group by unit type
     by_unit = {}
-    for item in items:
-        unit_id = item.get("unitId") or "General"
-        if unit_id not in by_unit:
-            by_unit[unit_id] = []
-        by_unit[unit_id].append(item)
+    for row in rows:
+        by_unit.setdefault(row.unit_id, []).append(row)
 
-    for unit_id, unit_items in by_unit.items():
+    for unit_id, unit_rows in by_unit.items():
         elements.append(Paragraph(f"Unit: {unit_id}", styles["SubSection"]))
 
         table_data = [["#", "Category", "Configuration", "Dimensions", "Glass", "Qty"]]
 
-        for i, item in enumerate(unit_items, 1):
-            cat = item.get("category", "").replace("_", " ").title()
-            config = item.get("configuration", "").replace("-", " ").title()
-            dims = item.get("dimensions", {})
-            w = dims.get("width", {}).get("value")
-            h = dims.get("height", {}).get("value")
-            dim_str = ""
-            if w and h:
-                dim_str = f'{w:.0f}" x {h:.0f}"'
-            elif w:
-                dim_str = f'{w:.0f}" W'
-            elif h:
-                dim_str = f'{h:.0f}" H'
-            else:
-                dim_str = "TBV"
-
-            flags = item.get("flags", [])
-            if "TO_BE_VERIFIED_IN_FIELD" in flags:
+        for i, row in enumerate(unit_rows, 1):
+            dim_str = _format_item_dims(row.width, row.height)
+            if row.tbv:
                 dim_str += " *"
 
-            glass = item.get("glassType", "")
-            qty = str(item.get("quantityPerUnit", 1))
+            table_data.append([
+                str(i), _category_label(row.category or ""), row.configuration,
+                dim_str, row.glass, str(row.qty),
+            ])
 
-            table_data.append([str(i), cat, config, dim_str, glass, qty])
-
-        t = Table(
+        t = LongTable(
             table_data,
             colWidths=[0.4 * inch, 1.5 * inch, 1.5 * inch, 1.2 * inch, 1.5 * inch, 0.5 * inch],
+            repeatRows=1,
         )
-        t.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), PRIMARY),
-            ("TEXTCOLOR", (0, 0), (-1, 0), white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 8),
-            ("ALIGN", (0, 0), (0, -1), "CENTER"),
-            ("ALIGN", (-1, 0), (-1, -1), "CENTER"),
-            ("GRID", (0, 0), (-1, -1), 0.5, BORDER),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [white, LIGHT_BG]),
-            ("TOPPADDING", (0, 0), (-1, -1), 4),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ]))
+        t.setStyle(_SCOPE_TABLE_STYLE)
         elements.append(t)
         elements.append(Spacer(1, 0.15 * inch))
 
@@ -315,7 +427,7 @@ def _build_pricing_table(ssot: dict, styles) -> list:
     """Build the pricing breakdown table."""
     elements = []
     elements.append(Paragraph("3. Pricing Breakdown", styles["SectionTitle"]))
-    elements.append(HRFlowable(width="100%", thickness=1, color=BORDER))
+    elements.append(_section_hr())
     elements.append(Spacer(1, 0.1 * inch))
 
     pricing = ssot.get("pricing", {})
@@ -330,37 +442,25 @@ def _build_pricing_table(ssot: dict, styles) -> list:
         total = f"${li.get('totalPrice', 0):,.2f}"
         table_data.append([str(i), desc, qty, unit_price, total])
 
-    # Totals
-    table_data.append(["", "", "", "Subtotal:", f"${pricing.get('subtotal', 0):,.2f}"])
-    if pricing.get("tax", 0) > 0:
-        table_data.append(["", "", "", "Tax:", f"${pricing.get('tax', 0):,.2f}"])
-    table_data.append(["", "", "", "TOTAL:", f"${pricing.get('total', 0):,.2f}"])
-
-    t = Table(
+    # Line items stream across pages with the header repeated; the totals
+    # are a separate fixed table so they never force a re-layout of the
+    # itemized rows.
+    t = LongTable(
         table_data,
         colWidths=[0.4 * inch, 3.2 * inch, 0.5 * inch, 1.2 * inch, 1.2 * inch],
+        repeatRows=1,
     )
-
-    n_items = len(line_items)
-    t.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), PRIMARY),
-        ("TEXTCOLOR", (0, 0), (-1, 0), white),
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, -1), 9),
-        ("ALIGN", (0, 0), (0, -1), "CENTER"),
-        ("ALIGN", (2, 0), (2, -1), "CENTER"),
-        ("ALIGN", (3, 0), (-1, -1), "RIGHT"),
-        ("GRID", (0, 0), (-1, n_items), 0.5, BORDER),
-        ("ROWBACKGROUNDS", (0, 1), (-1, n_items), [white, LIGHT_BG]),
-        ("TOPPADDING", (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-        # Totals formatting
-        ("FONTNAME", (3, n_items + 1), (-1, -1), "Helvetica-Bold"),
-        ("LINEABOVE", (3, n_items + 1), (-1, n_items + 1), 1, BORDER),
-        ("LINEABOVE", (-2, -1), (-1, -1), 2, PRIMARY),
-        ("FONTSIZE", (-2, -1), (-1, -1), 11),
-    ]))
+    t.setStyle(_PRICING_TABLE_STYLE)
     elements.append(t)
+
+    totals_data = [["", "Subtotal:", f"${pricing.get('subtotal', 0):,.2f}"]]
+    if pricing.get("tax", 0) > 0:
+        totals_data.append(["", "Tax:", f"${pricing.get('tax', 0):,.2f}"])
+    totals_data.append(["", "TOTAL:", f"${pricing.get('total', 0):,.2f}"])
+
+    totals = Table(totals_data, colWidths=_PRICING_TOTALS_COL_WIDTHS)
+    totals.setStyle(_PRICING_TOTALS_STYLE)
+    elements.append(KeepTogether([totals]))
     elements.append(Spacer(1, 0.3 * inch))
     return elements
 
@@ -369,7 +469,7 @@ def _build_assumptions(ssot: dict, styles) -> list:
     """Build assumptions and exclusions section."""
     elements = []
     elements.append(Paragraph("4. Assumptions and Exclusions", styles["SectionTitle"]))
-    elements.append(HRFlowable(width="100%", thickness=1, color=BORDER))
+    elements.append(_section_hr())
     elements.append(Spacer(1, 0.1 * inch))
 
     assumptions = ssot.get("assumptions", [])
@@ -377,14 +477,16 @@ def _build_assumptions(ssot: dict, styles) -> list:
 
     if assumptions:
         elements.append(Paragraph("Assumptions:", styles["SubSection"]))
-        for a in assumptions:
-            elements.append(Paragraph(f"• {a}", styles["BodyText2"]))
+        elements.append(Paragraph(
+            "<br/>".join(f"• {a}" for a in assumptions), styles["BodyText2"],
+        ))
         elements.append(Spacer(1, 0.15 * inch))
 
     if exclusions:
         elements.append(Paragraph("Exclusions:", styles["SubSection"]))
-        for e in exclusions:
-            elements.append(Paragraph(f"• {e}", styles["BodyText2"]))
+        elements.append(Paragraph(
+            "<br/>".join(f"• {e}" for e in exclusions), styles["BodyText2"],
+        ))
         elements.append(Spacer(1, 0.15 * inch))
 
     if not assumptions and not exclusions:
@@ -402,7 +504,7 @@ def _build_alternates(ssot: dict, styles) -> list:
 
     elements = []
     elements.append(Paragraph("5. Alternates", styles["SectionTitle"]))
-    elements.append(HRFlowable(width="100%", thickness=1, color=BORDER))
+    elements.append(_section_hr())
     elements.append(Spacer(1, 0.1 * inch))
 
     table_data = [["Alt #", "Description", "Add/Deduct"]]
@@ -416,16 +518,7 @@ def _build_alternates(ssot: dict, styles) -> list:
         ])
 
     t = Table(table_data, colWidths=[0.8 * inch, 4 * inch, 1.5 * inch])
-    t.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), PRIMARY),
-        ("TEXTCOLOR", (0, 0), (-1, 0), white),
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, -1), 9),
-        ("ALIGN", (-1, 0), (-1, -1), "RIGHT"),
-        ("GRID", (0, 0), (-1, -1), 0.5, BORDER),
-        ("TOPPADDING", (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-    ]))
+    t.setStyle(_ALTERNATES_TABLE_STYLE)
     elements.append(t)
     elements.append(Spacer(1, 0.3 * inch))
     return elements
@@ -435,7 +528,7 @@ def _build_terms(styles) -> list:
     """Build terms and conditions (boilerplate)."""
     elements = []
     elements.append(Paragraph("Terms and Conditions", styles["SectionTitle"]))
-    elements.append(HRFlowable(width="100%", thickness=1, color=BORDER))
+    elements.append(_section_hr())
     elements.append(Spacer(1, 0.1 * inch))
 
     terms = [
@@ -449,33 +542,39 @@ def _build_terms(styles) -> list:
         "Building access and site conditions must be suitable for installation.",
     ]
 
-    for i, term in enumerate(terms, 1):
-        elements.append(Paragraph(f"{i}. {term}", styles["BodyText2"]))
-        elements.append(Spacer(1, 0.05 * inch))
+    # One flowable for the whole list; each term is a single line of text.
+    elements.append(Paragraph(
+        "<br/>".join(f"{i}. {term}" for i, term in enumerate(terms, 1)),
+        styles["BodyText2"],
+    ))
 
     return elements
 
 
-def generate_bid_pdf(ssot: dict, output_path: str) -> str:
+def generate_bid_pdf(
+    ssot: dict, output: Union[str, os.PathLike, BinaryIO],
+) -> Union[str, os.PathLike, BinaryIO]:
     """Generate the Bid / Breakdown PDF from SSOT.
 
     Args:
         ssot: The complete SSOT JSON dict.
-        output_path: Local file path to write the PDF.
+        output: Local file path to write the PDF, or a writable binary
+            stream (e.g. ``io.BytesIO``) to render into without touching disk.
 
     Returns:
-        The output file path.
+        ``output``, unchanged.
     """
-    logger.info("Generating Bid PDF", output_path=output_path)
-
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    is_path = isinstance(output, (str, os.PathLike))
+    if is_path:
+        os.makedirs(os.path.dirname(output), exist_ok=True)
     styles = _get_styles()
+    rows = _normalize_items(ssot.get("items", []))
 
     metadata = ssot.get("metadata", {})
     project_name = metadata.get("projectName", "Untitled")
 
     doc = SimpleDocTemplate(
-        output_path,
+        output,
         pagesize=letter,
         leftMargin=0.75 * inch,
         rightMargin=0.75 * inch,
@@ -488,8 +587,8 @@ def generate_bid_pdf(ssot: dict, output_path: str) -> str:
     elements = []
     elements.extend(_build_cover_page(ssot, styles))
     elements.extend(_build_toc(ssot, styles))
-    elements.extend(_build_executive_summary(ssot, styles))
-    elements.extend(_build_scope_of_work(ssot, styles))
+    elements.extend(_build_executive_summary(ssot, rows, styles))
+    elements.extend(_build_scope_of_work(ssot, rows, styles))
 
     elements.append(PageBreak())
     elements.extend(_build_pricing_table(ssot, styles))
@@ -501,5 +600,9 @@ def generate_bid_pdf(ssot: dict, output_path: str) -> str:
 
     doc.build(elements)
 
-    logger.info("Bid PDF generated", output_path=output_path, pages="multi")
-    return output_path
+    # One event per PDF: structlog runs the full processor chain on every
+    # call, with no level check to short-circuit a disabled sink.
+    logger.info(
+        "Bid PDF generated", output_path=output if is_path else "<stream>", pages="multi",
+    )
+    return output
@@ -4,10 +4,14 @@ Provides reusable drawing primitives: title blocks, revision boxes,
 dimension leaders, hardware callout bubbles, etc.
 """
 
+import math
+from functools import lru_cache
+
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, white
 from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
 # ─── Constants ───────────────────────────────────────────────────────────────
 
@@ -30,6 +34,67 @@ LINE_COLOR = HexColor("#2d3748")
 DIM_COLOR = HexColor("#e53e3e")
 NOTE_COLOR = HexColor("#718096")
 
+_INV_SQRT2 = 1 / math.sqrt(2)
+
+# ─── Title Block / Revision Box Geometry ─────────────────────────────────────
+# Both sit at fixed page positions, so lay them out once.
+
+_TITLE_W = 4 * inch
+_TITLE_X = PAGE_WIDTH - MARGIN - _TITLE_W
+_TITLE_Y = MARGIN
+_TITLE_INNER_LEFT = _TITLE_X + 0.15 * inch
+_TITLE_INNER_RIGHT = _TITLE_X + _TITLE_W - 0.15 * inch
+_TITLE_HEADER_Y = _TITLE_Y + TITLE_BLOCK_HEIGHT - 0.25 * inch
+_TITLE_DIVIDER = (
+    _TITLE_X + 0.1 * inch, _TITLE_Y + TITLE_BLOCK_HEIGHT - 0.35 * inch,
+    _TITLE_X + _TITLE_W - 0.1 * inch, _TITLE_Y + TITLE_BLOCK_HEIGHT - 0.35 * inch,
+)
+_TITLE_VALUE_INDENT = 0.55 * inch
+# Value width up to the next column, less a small gap
+_TITLE_VALUE_MAX_W = 2 * inch - 0.15 * inch - _TITLE_VALUE_INDENT - 0.05 * inch
+# Six fields in two columns, three rows
+_TITLE_FIELD_POSITIONS = tuple(
+    (
+        _TITLE_INNER_LEFT if i % 2 == 0 else _TITLE_X + 2 * inch,
+        _TITLE_Y + TITLE_BLOCK_HEIGHT - 0.55 * inch - (i // 2) * 0.22 * inch,
+    )
+    for i in range(6)
+)
+
+_REV_X = PAGE_WIDTH - MARGIN - REVISION_BOX_WIDTH
+_REV_Y = PAGE_HEIGHT - MARGIN - REVISION_BOX_HEIGHT
+_REV_HEADER_Y = _REV_Y + REVISION_BOX_HEIGHT - 0.2 * inch
+_REV_CENTER_X = _REV_X + REVISION_BOX_WIDTH / 2
+_REV_TITLE_Y = _REV_Y + REVISION_BOX_HEIGHT - 0.16 * inch
+_REV_COLUMN_HEADER_Y = _REV_Y + REVISION_BOX_HEIGHT - 0.35 * inch
+_REV_COLUMNS = (_REV_X + 0.05 * inch, _REV_X + 0.35 * inch, _REV_X + 1.0 * inch)
+_REV_DATE_MAX_W = 0.6 * inch
+_REV_DESC_MAX_W = REVISION_BOX_WIDTH - 1.0 * inch - 0.1 * inch
+_REV_ROW_YS = tuple(
+    _REV_Y + REVISION_BOX_HEIGHT - 0.5 * inch - i * 0.12 * inch for i in range(3)
+)
+
+_NOTES_DEFAULT_Y = DRAWING_AREA_BOTTOM + 0.1 * inch
+
+
+@lru_cache(maxsize=4096)
+def _fit_text(text: str, font: str, size: float, max_width: float) -> str:
+    """Longest prefix of ``text`` that fits in ``max_width`` points.
+
+    Measured with the font's metrics rather than a character count, so
+    wide glyphs and accented names cannot overflow their field.
+    """
+    if stringWidth(text, font, size) <= max_width:
+        return text
+    lo, hi = 0, len(text)  # text[:lo] fits, text[:hi] does not
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if stringWidth(text[:mid], font, size) <= max_width:
+            lo = mid
+        else:
+            hi = mid
+    return text[:lo]
+
 
 def draw_title_block(
     c: Canvas,
@@ -42,31 +107,25 @@ def draw_title_block(
     drawn_by: str = "System",
 ) -> None:
     """Draw the title block in the bottom-right corner."""
-    x = PAGE_WIDTH - MARGIN - 4 * inch
-    y = MARGIN
-    w = 4 * inch
-    h = TITLE_BLOCK_HEIGHT
-
     # Background
     c.setFillColor(PRIMARY_COLOR)
-    c.rect(x, y, w, h, fill=1, stroke=0)
+    c.rect(_TITLE_X, _TITLE_Y, _TITLE_W, TITLE_BLOCK_HEIGHT, fill=1, stroke=0)
 
     # Company name
     c.setFillColor(white)
     c.setFont("Helvetica-Bold", 12)
-    c.drawString(x + 0.15 * inch, y + h - 0.25 * inch, "LUXURIUS GLASS")
+    c.drawString(_TITLE_INNER_LEFT, _TITLE_HEADER_Y, "LUXURIUS GLASS")
 
     # Drawing number (large)
     c.setFont("Helvetica-Bold", 14)
-    c.drawRightString(x + w - 0.15 * inch, y + h - 0.25 * inch, drawing_num)
+    c.drawRightString(_TITLE_INNER_RIGHT, _TITLE_HEADER_Y, drawing_num)
 
     # Divider line
     c.setStrokeColor(white)
     c.setLineWidth(0.5)
-    c.line(x + 0.1 * inch, y + h - 0.35 * inch, x + w - 0.1 * inch, y + h - 0.35 * inch)
+    c.line(*_TITLE_DIVIDER)
 
     # Info fields
-    c.setFont("Helvetica", 7)
     fields = [
         ("PROJECT:", project_name),
         ("CLIENT:", client_name),
@@ -76,18 +135,16 @@ def draw_title_block(
         ("REV:", revision),
     ]
 
-    col1_x = x + 0.15 * inch
-    col2_x = x + 2 * inch
-    row_y = y + h - 0.55 * inch
-
-    for i, (label, value) in enumerate(fields):
-        col = col1_x if i % 2 == 0 else col2_x
-        row = row_y - (i // 2) * 0.22 * inch
-
-        c.setFont("Helvetica-Bold", 6)
+    # Labels then values, so the font only changes twice
+    c.setFont("Helvetica-Bold", 6)
+    for (col, row), (label, _) in zip(_TITLE_FIELD_POSITIONS, fields):
         c.drawString(col, row, label)
-        c.setFont("Helvetica", 7)
-        c.drawString(col + 0.55 * inch, row, str(value)[:30])
+    c.setFont("Helvetica", 7)
+    for (col, row), (_, value) in zip(_TITLE_FIELD_POSITIONS, fields):
+        c.drawString(
+            col + _TITLE_VALUE_INDENT, row,
+            _fit_text(str(value), "Helvetica", 7, _TITLE_VALUE_MAX_W),
+        )
 
 
 def draw_revision_box(
@@ -98,34 +155,81 @@ def draw_revision_box(
 
     Each revision: {"rev": "1", "date": "2024-01-15", "description": "Initial"}
     """
-    x = PAGE_WIDTH - MARGIN - REVISION_BOX_WIDTH
-    y = PAGE_HEIGHT - MARGIN - REVISION_BOX_HEIGHT
-
     c.setStrokeColor(LINE_COLOR)
     c.setLineWidth(0.75)
-    c.rect(x, y, REVISION_BOX_WIDTH, REVISION_BOX_HEIGHT, fill=0)
+    c.rect(_REV_X, _REV_Y, REVISION_BOX_WIDTH, REVISION_BOX_HEIGHT, fill=0)
 
     # Header
     c.setFillColor(PRIMARY_COLOR)
-    c.rect(x, y + REVISION_BOX_HEIGHT - 0.2 * inch, REVISION_BOX_WIDTH, 0.2 * inch, fill=1, stroke=0)
+    c.rect(_REV_X, _REV_HEADER_Y, REVISION_BOX_WIDTH, 0.2 * inch, fill=1, stroke=0)
     c.setFillColor(white)
     c.setFont("Helvetica-Bold", 7)
-    c.drawCentredString(x + REVISION_BOX_WIDTH / 2, y + REVISION_BOX_HEIGHT - 0.16 * inch, "REVISIONS")
+    c.drawCentredString(_REV_CENTER_X, _REV_TITLE_Y, "REVISIONS")
 
     # Column headers
+    rev_x, date_x, desc_x = _REV_COLUMNS
     c.setFillColor(LINE_COLOR)
     c.setFont("Helvetica-Bold", 5)
-    c.drawString(x + 0.05 * inch, y + REVISION_BOX_HEIGHT - 0.35 * inch, "REV")
-    c.drawString(x + 0.35 * inch, y + REVISION_BOX_HEIGHT - 0.35 * inch, "DATE")
-    c.drawString(x + 1.0 * inch, y + REVISION_BOX_HEIGHT - 0.35 * inch, "DESCRIPTION")
+    c.drawString(rev_x, _REV_COLUMN_HEADER_Y, "REV")
+    c.drawString(date_x, _REV_COLUMN_HEADER_Y, "DATE")
+    c.drawString(desc_x, _REV_COLUMN_HEADER_Y, "DESCRIPTION")
 
     if revisions:
         c.setFont("Helvetica", 5)
-        for i, rev in enumerate(revisions[:3]):  # Max 3 rows
-            row_y = y + REVISION_BOX_HEIGHT - 0.5 * inch - i * 0.12 * inch
-            c.drawString(x + 0.05 * inch, row_y, str(rev.get("rev", "")))
-            c.drawString(x + 0.35 * inch, row_y, str(rev.get("date", ""))[:10])
-            c.drawString(x + 1.0 * inch, row_y, str(rev.get("description", ""))[:20])
+        for row_y, rev in zip(_REV_ROW_YS, revisions):  # Max 3 rows
+            c.drawString(rev_x, row_y, str(rev.get("rev", "")))
+            c.drawString(
+                date_x, row_y,
+                _fit_text(str(rev.get("date", "")), "Helvetica", 5, _REV_DATE_MAX_W),
+            )
+            c.drawString(
+                desc_x, row_y,
+                _fit_text(str(rev.get("description", "")), "Helvetica", 5, _REV_DESC_MAX_W),
+            )
+
+
+def _dimension_geometry(
+    x1: float, y1: float, x2: float, y2: float, offset: float,
+) -> tuple[list[tuple[float, float, float, float]], float, float] | None:
+    """Segments (extensions, dimension line, ticks) and label anchor.
+
+    Returns None for a degenerate (zero-length) dimension.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    length = math.hypot(dx, dy)
+
+    if length < 0.01:
+        return None
+
+    # Unit direction (cos, sin of the line angle) -- no atan2/cos/sin needed
+    ux = dx / length
+    uy = dy / length
+
+    # Normal direction for offset
+    nx = -uy * offset
+    ny = ux * offset
+
+    dim_x1, dim_y1 = x1 + nx, y1 + ny
+    dim_x2, dim_y2 = x2 + nx, y2 + ny
+
+    # Arrowheads (small ticks at 45 degrees to the line):
+    # cos(a + pi/4) = (cos a - sin a) / sqrt(2), sin(a + pi/4) = (sin a + cos a) / sqrt(2)
+    tick_len = 3
+    tx = tick_len * (ux - uy) * _INV_SQRT2
+    ty = tick_len * (uy + ux) * _INV_SQRT2
+
+    segments = [
+        # Extension lines
+        (x1, y1, dim_x1, dim_y1),
+        (x2, y2, dim_x2, dim_y2),
+        # Dimension line
+        (dim_x1, dim_y1, dim_x2, dim_y2),
+        # Ticks
+        (dim_x1 - tx, dim_y1 - ty, dim_x1 + tx, dim_y1 + ty),
+        (dim_x2 - tx, dim_y2 - ty, dim_x2 + tx, dim_y2 + ty),
+    ]
+    return segments, (dim_x1 + dim_x2) / 2, (dim_y1 + dim_y2) / 2
 
 
 def draw_dimension_line(
@@ -140,7 +244,10 @@ def draw_dimension_line(
 
     Draws a line between two points with extension lines and a centered dimension text.
     """
-    import math
+    geometry = _dimension_geometry(x1, y1, x2, y2, offset)
+    if geometry is None:
+        return
+    segments, mid_x, mid_y = geometry
 
     if color is None:
         color = DIM_COLOR
@@ -150,48 +257,76 @@ def draw_dimension_line(
     c.setFillColor(color)
     c.setLineWidth(0.5)
 
-    dx = x2 - x1
-    dy = y2 - y1
-    length = math.sqrt(dx * dx + dy * dy)
+    for seg in segments:
+        c.line(*seg)
 
-    if length < 0.01:
-        c.restoreState()
-        return
+    # Label
+    c.setFont("Helvetica-Bold", 7)
+    c.drawCentredString(mid_x, mid_y + 3, label)
 
-    # Normal direction for offset
-    nx = -dy / length * offset
-    ny = dx / length * offset
+    c.restoreState()
 
-    # Extension lines
-    c.line(x1, y1, x1 + nx, y1 + ny)
-    c.line(x2, y2, x2 + nx, y2 + ny)
 
-    # Dimension line
-    dim_x1, dim_y1 = x1 + nx, y1 + ny
-    dim_x2, dim_y2 = x2 + nx, y2 + ny
-    c.line(dim_x1, dim_y1, dim_x2, dim_y2)
+def draw_dimensions_batch(
+    c: Canvas,
+    dims: list[tuple[float, float, float, float, str]],
+    offset: float = 0.3 * inch,
+    color=None,
+) -> None:
+    """Draw several same-style dimensions as one stroked path.
 
-    # Arrowheads (small ticks)
-    tick_len = 3
-    angle = math.atan2(dy, dx)
-    for px, py in [(dim_x1, dim_y1), (dim_x2, dim_y2)]:
-        c.line(
-            px - tick_len * math.cos(angle + math.pi / 4),
-            py - tick_len * math.sin(angle + math.pi / 4),
-            px + tick_len * math.cos(angle + math.pi / 4),
-            py + tick_len * math.sin(angle + math.pi / 4),
-        )
+    Each dim is ``(x1, y1, x2, y2, label)``. Equivalent to calling
+    draw_dimension_line for each, but sets the graphics state once and
+    emits every segment through a single ``c.lines()`` call.
+    """
+    segments = []
+    labels = []
+    for x1, y1, x2, y2, label in dims:
+        geometry = _dimension_geometry(x1, y1, x2, y2, offset)
+        if geometry is not None:
+            segments.extend(geometry[0])
+            labels.append((geometry[1], geometry[2], label))
+
+    if not segments:
+        return
 
-    # Label
-    mid_x = (dim_x1 + dim_x2) / 2
-    mid_y = (dim_y1 + dim_y2) / 2
+    if color is None:
+        color = DIM_COLOR
+
+    c.saveState()
+    c.setStrokeColor(color)
+    c.setFillColor(color)
+    c.setLineWidth(0.5)
+    c.lines(segments)
 
     c.setFont("Helvetica-Bold", 7)
-    c.drawCentredString(mid_x, mid_y + 3, label)
+    for mid_x, mid_y, label in labels:
+        c.drawCentredString(mid_x, mid_y + 3, label)
 
     c.restoreState()
 
 
+_CALLOUT_RADIUS = 8
+_CALLOUT_BUBBLE_FORM = "callout_bubble"
+
+
+def _ensure_callout_bubble(c: Canvas) -> None:
+    """Define the callout bubble as a form XObject on ``c`` once.
+
+    The bubble is drawn centred on the origin; each callout places it
+    with ``doForm`` instead of repeating the circle's Bezier path.
+    """
+    if c.hasForm(_CALLOUT_BUBBLE_FORM):
+        return
+    r = _CALLOUT_RADIUS + 1  # room for the stroke
+    c.beginForm(_CALLOUT_BUBBLE_FORM, -r, -r, r, r)
+    c.setStrokeColor(SECONDARY_COLOR)
+    c.setFillColor(white)
+    c.setLineWidth(1)
+    c.circle(0, 0, _CALLOUT_RADIUS, fill=1, stroke=1)
+    c.endForm()
+
+
 def draw_hardware_callout(
     c: Canvas,
     x: float, y: float,
@@ -199,27 +334,49 @@ def draw_hardware_callout(
     label: str,
 ) -> None:
     """Draw a hardware callout bubble with number."""
+    draw_hardware_callouts(c, [(x, y, number, label)])
+
+
+def draw_hardware_callouts(
+    c: Canvas,
+    callouts: list[tuple[float, float, int, str]],
+) -> None:
+    """Draw several hardware callouts inside one saved graphics state.
+
+    Each callout is ``(x, y, number, label)``. Bubbles, numbers, leaders
+    and labels are each drawn as a group so colors, fonts and line widths
+    are set once per kind rather than once per callout.
+    """
+    if not callouts:
+        return
+
+    radius = _CALLOUT_RADIUS
+    _ensure_callout_bubble(c)
     c.saveState()
 
-    # Circle
-    radius = 8
-    c.setStrokeColor(SECONDARY_COLOR)
-    c.setFillColor(white)
-    c.setLineWidth(1)
-    c.circle(x, y, radius, fill=1, stroke=1)
+    # Bubbles: step the origin from one callout to the next and place
+    # the shared form, instead of emitting a fresh circle path each time.
+    px = py = 0.0
+    for x, y, _, _ in callouts:
+        c.translate(x - px, y - py)
+        c.doForm(_CALLOUT_BUBBLE_FORM)
+        px, py = x, y
+    c.translate(-px, -py)
 
-    # Number
+    # Numbers
     c.setFillColor(SECONDARY_COLOR)
     c.setFont("Helvetica-Bold", 7)
-    c.drawCentredString(x, y - 2.5, str(number))
+    for x, y, number, _ in callouts:
+        c.drawCentredString(x, y - 2.5, str(number))
 
-    # Leader line + label
+    # Leader lines + labels
     c.setStrokeColor(NOTE_COLOR)
     c.setLineWidth(0.5)
-    c.line(x + radius, y, x + radius + 15, y)
+    c.lines([(x + radius, y, x + radius + 15, y) for x, y, _, _ in callouts])
     c.setFont("Helvetica", 6)
     c.setFillColor(NOTE_COLOR)
-    c.drawString(x + radius + 18, y - 2, label[:35])
+    for x, y, _, label in callouts:
+        c.drawString(x + radius + 18, y - 2, label[:35])
 
     c.restoreState()
 
@@ -234,17 +391,21 @@ def draw_notes_zone(
     if x is None:
         x = DRAWING_AREA_LEFT
     if y is None:
-        y = DRAWING_AREA_BOTTOM + 0.1 * inch
+        y = _NOTES_DEFAULT_Y
 
     c.saveState()
     c.setFont("Helvetica-Bold", 7)
     c.setFillColor(LINE_COLOR)
     c.drawString(x, y + len(notes) * 10 + 5, "NOTES:")
 
-    c.setFont("Helvetica", 6)
-    c.setFillColor(NOTE_COLOR)
+    # One text object for the whole list; the 10pt leading steps each
+    # note down from the top line.
+    text = c.beginText(x + 5, y + (len(notes) - 1) * 10)
+    text.setFont("Helvetica", 6, leading=10)
+    text.setFillColor(NOTE_COLOR)
     for i, note in enumerate(notes):
-        c.drawString(x + 5, y + (len(notes) - i - 1) * 10, f"{i + 1}. {note[:80]}")
+        text.textLine(f"{i + 1}. {note[:80]}")
+    c.drawText(text)
 
     c.restoreState()
 
@@ -276,26 +437,42 @@ def draw_tbv_placeholder(
     label: str = "TBV",
 ) -> None:
     """Draw a 'To Be Verified' placeholder (dashed line + TBV label)."""
+    draw_tbv_placeholders(c, [(x1, y1, x2, y2)], label)
+
+
+def draw_tbv_placeholders(
+    c: Canvas,
+    spans: list[tuple[float, float, float, float]],
+    label: str = "TBV",
+) -> None:
+    """Draw several TBV placeholders inside one saved graphics state.
+
+    Each span is ``(x1, y1, x2, y2)``; the dashed lines go out as one path.
+    """
+    if not spans:
+        return
+
     c.saveState()
 
     c.setStrokeColor(DIM_COLOR)
     c.setLineWidth(0.75)
     c.setDash(3, 3)
-    c.line(x1, y1, x2, y2)
+    c.lines(spans)
 
-    mid_x = (x1 + x2) / 2
-    mid_y = (y1 + y2) / 2
     c.setFont("Helvetica-Bold", 8)
     c.setFillColor(DIM_COLOR)
-    c.drawCentredString(mid_x, mid_y + 5, label)
+    for x1, y1, x2, y2 in spans:
+        c.drawCentredString((x1 + x2) / 2, (y1 + y2) / 2 + 5, label)
 
     c.restoreState()
 
 
+@lru_cache(maxsize=1024)
 def format_dimension(value: float | None, unit: str = "in") -> str:
     """Format a dimension value for display.
 
-    Converts decimal inches to feet-inches notation if >= 12".
+    Converts decimal inches to feet-inches notation if >= 12". Results are
+    memoized: the same handful of nominal sizes recur across a bid.
     """
     if value is None:
         return "TBV"
@@ -12,8 +12,8 @@ from ..drawing_utils import (
     DRAWING_AREA_LEFT, DRAWING_AREA_BOTTOM,
     DRAWING_AREA_WIDTH, DRAWING_AREA_HEIGHT,
     LINE_COLOR, DIM_COLOR, NOTE_COLOR,
-    draw_dimension_line, draw_hardware_callout,
-    draw_glass_annotation, draw_tbv_placeholder,
+    draw_dimension_line, draw_dimensions_batch, draw_hardware_callouts,
+    draw_glass_annotation, draw_tbv_placeholders,
     draw_notes_zone, format_dimension,
 )
 
@@ -100,25 +100,18 @@ def draw(canvas: Canvas, item: dict, config: dict) -> None:
     # ─── Dimension lines ─────────────────────────────────────────
     canvas.setLineWidth(0.5)
 
-    # Panel width
+    # Panel and door widths share one baseline
+    bottom_dims = []
+    tbv_spans = []
     if panel_w:
-        draw_dimension_line(
-            canvas,
-            panel_x, panel_y, panel_x + pw, panel_y,
-            format_dimension(panel_w),
-            offset=-0.25 * inch,
-        )
+        bottom_dims.append((panel_x, panel_y, panel_x + pw, panel_y, format_dimension(panel_w)))
     elif is_tbv:
-        draw_tbv_placeholder(canvas, panel_x, panel_y - 0.2 * inch, panel_x + pw, panel_y - 0.2 * inch)
+        tbv_spans.append((panel_x, panel_y - 0.2 * inch, panel_x + pw, panel_y - 0.2 * inch))
 
-    # Door width
     if door_w_raw:
-        draw_dimension_line(
-            canvas,
-            door_x, panel_y, door_x + dw, panel_y,
-            format_dimension(door_w_raw),
-            offset=-0.25 * inch,
-        )
+        bottom_dims.append((door_x, panel_y, door_x + dw, panel_y, format_dimension(door_w_raw)))
+
+    draw_dimensions_batch(canvas, bottom_dims, offset=-0.25 * inch)
 
     # Height
     if height:
@@ -130,11 +123,12 @@ def draw(canvas: Canvas, item: dict, config: dict) -> None:
             offset=0.25 * inch,
         )
     elif is_tbv:
-        draw_tbv_placeholder(
-            canvas,
+        tbv_spans.append((
             panel_x + pw + dw + 0.15 * inch, panel_y,
             panel_x + pw + dw + 0.15 * inch, panel_y + h,
-        )
+        ))
+
+    draw_tbv_placeholders(canvas, tbv_spans)
 
     # Total width
     total_w = (panel_w or 36) + (door_w_raw or 24)
@@ -153,15 +147,14 @@ def draw(canvas: Canvas, item: dict, config: dict) -> None:
     hinge_type = item.get("dimensions", {}).get("hinge_type") or "Standard"
     callout_y = panel_y + h * 0.7
 
-    draw_hardware_callout(canvas, door_x, callout_y, 1, f"Hinge: {hinge_type}")
-    if hw_items:
-        for i, hw in enumerate(hw_items[:2]):
-            draw_hardware_callout(
-                canvas,
-                door_x + dw * 0.5, callout_y - (i + 1) * 20,
-                i + 2,
-                f"{hw.get('type', 'Hardware')}: {hw.get('finish', '')}",
-            )
+    callouts = [(door_x, callout_y, 1, f"Hinge: {hinge_type}")]
+    for i, hw in enumerate(hw_items[:2]):
+        callouts.append((
+            door_x + dw * 0.5, callout_y - (i + 1) * 20,
+            i + 2,
+            f"{hw.get('type', 'Hardware')}: {hw.get('finish', '')}",
+        ))
+    draw_hardware_callouts(canvas, callouts)
 
     # ─── Notes ───────────────────────────────────────────────────
     notes = [
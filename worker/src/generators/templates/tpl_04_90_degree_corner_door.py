@@ -12,7 +12,7 @@ from ..drawing_utils import (
     DRAWING_AREA_LEFT, DRAWING_AREA_BOTTOM,
     DRAWING_AREA_WIDTH, DRAWING_AREA_HEIGHT,
     LINE_COLOR, NOTE_COLOR,
-    draw_dimension_line, draw_hardware_callout,
+    draw_dimension_line, draw_hardware_callouts,
     draw_glass_annotation, draw_tbv_placeholder,
     draw_notes_zone, format_dimension,
 )
@@ -135,18 +135,11 @@ def draw(canvas: Canvas, item: dict, config: dict) -> None:
     # ─── Annotations ─────────────────────────────────────────────
     draw_glass_annotation(canvas, elev_cx - 20, elev_cy, glass_type)
 
-    draw_hardware_callout(
-        canvas,
-        corner_x + glass_t, corner_y + pb_h, 1,
-        "Hinge",
-    )
-
-    # Corner clamp
-    draw_hardware_callout(
-        canvas,
-        corner_x + glass_t, corner_y + glass_t, 2,
-        "90° Corner Clamp",
-    )
+    draw_hardware_callouts(canvas, [
+        (corner_x + glass_t, corner_y + pb_h, 1, "Hinge"),
+        # Corner clamp
+        (corner_x + glass_t, corner_y + glass_t, 2, "90° Corner Clamp"),
+    ])
 
     notes = [
         f"Glass: {glass_type}",
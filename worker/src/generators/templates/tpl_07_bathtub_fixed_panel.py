@@ -13,7 +13,7 @@ from ..drawing_utils import (
     DRAWING_AREA_WIDTH, DRAWING_AREA_HEIGHT,
     LINE_COLOR, NOTE_COLOR,
     draw_dimension_line, draw_hardware_callout,
-    draw_glass_annotation, draw_tbv_placeholder,
+    draw_glass_annotation, draw_tbv_placeholders,
     draw_notes_zone, format_dimension,
 )
 
@@ -72,6 +72,7 @@ def draw(canvas: Canvas, item: dict, config: dict) -> None:
     canvas.rect(panel_x - 2, panel_y - channel_h / 2, pw + 4, channel_h, fill=1, stroke=1)
 
     # ─── Dimensions ──────────────────────────────────────────────
+    tbv_spans = []
     if panel_w:
         draw_dimension_line(
             canvas,
@@ -80,7 +81,7 @@ def draw(canvas: Canvas, item: dict, config: dict) -> None:
             offset=0.25 * inch,
         )
     elif is_tbv:
-        draw_tbv_placeholder(canvas, panel_x, panel_y + ph + 10, panel_x + pw, panel_y + ph + 10)
+        tbv_spans.append((panel_x, panel_y + ph + 10, panel_x + pw, panel_y + ph + 10))
 
     if panel_h:
         draw_dimension_line(
@@ -90,7 +91,9 @@ def draw(canvas: Canvas, item: dict, config: dict) -> None:
             offset=0.25 * inch,
         )
     elif is_tbv:
-        draw_tbv_placeholder(canvas, panel_x + pw + 10, panel_y, panel_x + pw + 10, panel_y + ph)
+        tbv_spans.append((panel_x + pw + 10, panel_y, panel_x + pw + 10, panel_y + ph))
+
+    draw_tbv_placeholders(canvas, tbv_spans)
 
     # ─── Annotations ─────────────────────────────────────────────
     draw_glass_annotation(canvas, cx - 25, panel_y + ph / 2, glass_type)
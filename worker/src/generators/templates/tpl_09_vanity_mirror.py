@@ -13,7 +13,7 @@ from ..drawing_utils import (
     DRAWING_AREA_WIDTH, DRAWING_AREA_HEIGHT,
     LINE_COLOR, NOTE_COLOR, SECONDARY_COLOR,
     draw_dimension_line, draw_hardware_callout,
-    draw_tbv_placeholder, draw_notes_zone, format_dimension,
+    draw_tbv_placeholders, draw_notes_zone, format_dimension,
 )
 
 
@@ -69,6 +69,7 @@ def draw(canvas: Canvas, item: dict, config: dict) -> None:
         canvas.rect(mx + bevel, my + bevel, mw - 2 * bevel, mh - 2 * bevel, fill=0)
 
     # ─── Dimensions ──────────────────────────────────────────────
+    tbv_spans = []
     if mirror_w:
         draw_dimension_line(
             canvas,
@@ -77,7 +78,7 @@ def draw(canvas: Canvas, item: dict, config: dict) -> None:
             offset=0.25 * inch,
         )
     elif is_tbv:
-        draw_tbv_placeholder(canvas, mx, my + mh + 10, mx + mw, my + mh + 10)
+        tbv_spans.append((mx, my + mh + 10, mx + mw, my + mh + 10))
 
     if mirror_h:
         draw_dimension_line(
@@ -87,7 +88,9 @@ def draw(canvas: Canvas, item: dict, config: dict) -> None:
             offset=0.25 * inch,
         )
     elif is_tbv:
-        draw_tbv_placeholder(canvas, mx + mw + 10, my, mx + mw + 10, my + mh)
+        tbv_spans.append((mx + mw + 10, my, mx + mw + 10, my + mh))
+
+    draw_tbv_placeholders(canvas, tbv_spans)
 
     # ─── Annotations ─────────────────────────────────────────────
     draw_hardware_callout(canvas, mx, my + mh / 2, 1, f"Edge: {edge_type}")
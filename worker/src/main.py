@@ -239,6 +239,9 @@ def startup() -> None:
     except Exception as e:
         logger.warning("Could not write initial heartbeat", error=str(e))
 
+    # Later heartbeats are written off the poll loop
+    db.start_heartbeat_loop()
+
 
 # ─── Main Loop ───────────────────────────────────────────────────────────────
 
@@ -44,18 +44,19 @@ SCHEDULE_DIM_PATTERN = re.compile(
 
 # ─── Shower/Mirror detection keywords ────────────────────────────────────────
 
-SHOWER_KEYWORDS = [
+# Order-independent: any hit maps to the same category.
+SHOWER_KEYWORDS = frozenset({
     "shower enclosure", "frameless shower", "glass enclosure",
     "shower door", "glass panel", "fixed panel", "inline panel",
     "neo-angle", "90 degree", "90°", "corner shower",
     "bypass", "sliding shower", "steam shower",
     "bathtub enclosure", "tub panel",
-]
+})
 
-MIRROR_KEYWORDS = [
+MIRROR_KEYWORDS = frozenset({
     "vanity mirror", "bathroom mirror", "mirror",
     "beveled mirror", "frameless mirror",
-]
+})
 
 CONFIGURATION_KEYWORDS = {
     "inline-panel": ["inline panel", "fixed panel", "single panel"],
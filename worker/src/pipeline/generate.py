@@ -8,6 +8,9 @@ import os
 import json
 import uuid
 import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 
 import structlog
@@ -20,6 +23,8 @@ from ..generators.bid_pdf import generate_bid_pdf
 
 logger = structlog.get_logger()
 
+_pdf_pool = None
+
 
 def _compute_sha256(file_path: str) -> str:
     """Compute SHA256 hash of a file."""
@@ -30,6 +35,59 @@ def _compute_sha256(file_path: str) -> str:
     return h.hexdigest()
 
 
+def _get_pdf_pool():
+    """Process pool for ReportLab renders, or None to render in-process.
+
+    ReportLab's layout engine is pure Python and holds the GIL for a whole
+    document; with PDF_RENDER_PROCESSES > 0 the bid and shop drawings
+    render on separate cores. Spawned, so children do not inherit the
+    parent's threads or pooled DB connections.
+    """
+    global _pdf_pool
+    if config.PDF_RENDER_PROCESSES <= 0:
+        return None
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=config.PDF_RENDER_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pdf_pool
+
+
+def _discard_pdf_pool(pool) -> None:
+    """Drop a broken pool so the next _get_pdf_pool() call starts a fresh one."""
+    global _pdf_pool
+    if _pdf_pool is pool:
+        _pdf_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit_pdf(pool, fn, *args):
+    """Queue ``fn(*args)`` on ``pool``; None if there is no usable pool."""
+    if pool is None:
+        return None
+    try:
+        return pool.submit(fn, *args)
+    except BrokenProcessPool:
+        _discard_pdf_pool(pool)
+        return None
+
+
+def _render_pdf(pool, future, fn, *args):
+    """Wait for a pooled render, or run ``fn(*args)`` in-process.
+
+    Falls back to rendering in-process when there is no future or the
+    render process died (BrokenProcessPool); the dead pool is discarded.
+    """
+    if future is not None:
+        try:
+            return future.result()
+        except BrokenProcessPool as e:
+            logger.warning("PDF render process died; rendering in-process", error=str(e))
+            _discard_pdf_pool(pool)
+    return fn(*args)
+
+
 def run_generation(job: dict) -> None:
     """Generate Bid PDF and Shop Drawings PDF from SSOT.
 
@@ -96,13 +154,28 @@ def run_generation(job: dict) -> None:
     temp_dir = os.path.join(config.TEMP_DIR, job_id)
     os.makedirs(temp_dir, exist_ok=True)
 
+    shop_filename = f"shop-drawings-v{shop_version}.pdf"
+    shop_local_path = os.path.join(temp_dir, shop_filename)
+
+    pdf_pool = _get_pdf_pool()
+    shop_render = None
+    if pdf_pool is not None:
+        try:
+            from ..generators.shop_drawings_pdf import generate_shop_drawings_pdf
+
+            # Start the shop drawings now so they render alongside the bid
+            shop_render = _submit_pdf(pdf_pool, generate_shop_drawings_pdf, ssot, shop_local_path)
+        except ImportError:
+            pass
+
     # ─── Generate Bid PDF ────────────────────────────────────────
     bid_filename = f"bid-v{bid_version}.pdf"
     bid_local_path = os.path.join(temp_dir, bid_filename)
     bid_minio_key = f"{project_id}/{job_id}/{bid_filename}"
 
     try:
-        generate_bid_pdf(ssot, bid_local_path)
+        bid_render = _submit_pdf(pdf_pool, generate_bid_pdf, ssot, bid_local_path)
+        _render_pdf(pdf_pool, bid_render, generate_bid_pdf, ssot, bid_local_path)
         bid_sha256 = _compute_sha256(bid_local_path)
         bid_size = os.path.getsize(bid_local_path)
 
@@ -155,11 +228,9 @@ def run_generation(job: dict) -> None:
     try:
         from ..generators.shop_drawings_pdf import generate_shop_drawings_pdf
 
-        shop_filename = f"shop-drawings-v{shop_version}.pdf"
-        shop_local_path = os.path.join(temp_dir, shop_filename)
         shop_minio_key = f"{project_id}/{job_id}/{shop_filename}"
 
-        generate_shop_drawings_pdf(ssot, shop_local_path)
+        _render_pdf(pdf_pool, shop_render, generate_shop_drawings_pdf, ssot, shop_local_path)
         shop_sha256 = _compute_sha256(shop_local_path)
         shop_size = os.path.getsize(shop_local_path)
 
@@ -42,6 +42,31 @@ def _get_active_pricebook():
         return dict(pricebook), [dict(r) for r in rules]
 
 
+def _price_unit(formula: dict, item: dict) -> float:
+    return float(formula.get("unitPrice", 0))
+
+
+def _price_per_sqft(formula: dict, item: dict) -> float:
+    rate = float(formula.get("rate", 0))
+    dims = item.get("dimensions", {})
+    width = dims.get("width", {}).get("value") or 0
+    height = dims.get("height", {}).get("value") or 0
+    sqft = (width * height) / 144.0  # inches to sqft
+    return rate * sqft
+
+
+def _price_fixed(formula: dict, item: dict) -> float:
+    return float(formula.get("amount", 0))
+
+
+# One dict probe per line item instead of a chain of string compares.
+_FORMULA_EVALUATORS = {
+    "unit_price": _price_unit,
+    "per_sqft": _price_per_sqft,
+    "fixed": _price_fixed,
+}
+
+
 def _evaluate_formula(formula: dict, item: dict) -> float:
     """Evaluate a simple pricing formula against an item.
 
@@ -50,23 +75,10 @@ def _evaluate_formula(formula: dict, item: dict) -> float:
     - {"type": "per_sqft", "rate": 25.0}
     - {"type": "fixed", "amount": 500.0}
     """
-    formula_type = formula.get("type", "unit_price")
-
-    if formula_type == "unit_price":
-        return float(formula.get("unitPrice", 0))
-
-    if formula_type == "per_sqft":
-        rate = float(formula.get("rate", 0))
-        dims = item.get("dimensions", {})
-        width = dims.get("width", {}).get("value") or 0
-        height = dims.get("height", {}).get("value") or 0
-        sqft = (width * height) / 144.0  # inches to sqft
-        return rate * sqft
-
-    if formula_type == "fixed":
-        return float(formula.get("amount", 0))
-
-    return 0.0
+    evaluator = _FORMULA_EVALUATORS.get(formula.get("type", "unit_price"))
+    if evaluator is None:
+        return 0.0
+    return evaluator(formula, item)
 
 
 def _rule_applies(rule: dict, item: dict) -> bool:
@@ -88,27 +100,32 @@ def _rule_applies(rule: dict, item: dict) -> bool:
     return True
 
 
+# (glass, hardware, labor, other) split based on industry norms
+_DEFAULT_SPLIT = (0.40, 0.25, 0.30, 0.05)
+_CATEGORY_SPLITS = {
+    "VANITY_MIRROR": (0.55, 0.10, 0.25, 0.10),
+}
+
+
 def _compute_breakdown(item: dict, unit_price: float, rules: list[dict]) -> dict:
     """Compute price breakdown (glass, hardware, labor, other)."""
-    # Default split based on industry norms
-    glass_pct = 0.40
-    hardware_pct = 0.25
-    labor_pct = 0.30
-    other_pct = 0.05
-
-    # Adjust based on category
-    if item.get("category") == "VANITY_MIRROR":
-        glass_pct = 0.55
-        hardware_pct = 0.10
-        labor_pct = 0.25
-        other_pct = 0.10
-
-    return {
-        "glass": round(unit_price * glass_pct, 2),
-        "hardware": round(unit_price * hardware_pct, 2),
-        "labor": round(unit_price * labor_pct, 2),
-        "other": round(unit_price * other_pct, 2),
-    }
+    return _compute_breakdown_batch([item], [unit_price])[0]
+
+
+def _compute_breakdown_batch(items: list[dict], unit_prices: list[float]) -> list[dict]:
+    """Compute the breakdown of every priced item in a quote in one pass."""
+    splits = _CATEGORY_SPLITS
+    default = _DEFAULT_SPLIT
+    breakdowns = []
+    for item, price in zip(items, unit_prices):
+        glass_pct, hardware_pct, labor_pct, other_pct = splits.get(item.get("category"), default)
+        breakdowns.append({
+            "glass": round(price * glass_pct, 2),
+            "hardware": round(price * hardware_pct, 2),
+            "labor": round(price * labor_pct, 2),
+            "other": round(price * other_pct, 2),
+        })
+    return breakdowns
 
 
 def run_pricing(job: dict) -> None:
@@ -144,6 +161,8 @@ def run_pricing(job: dict) -> None:
 
     line_items = []
     subtotal = 0.0
+    # Newly priced lines; their breakdowns are filled in one batch below.
+    priced_items, priced_lines, priced_unit_prices = [], [], []
 
     for item in items:
         item_id = item.get("itemId")
@@ -196,7 +215,6 @@ def run_pricing(job: dict) -> None:
                 unit_price = sqft * 35.0  # $35/sqft default
 
         total_price = round(unit_price * qty, 2)
-        breakdown = _compute_breakdown(item, unit_price, rules)
 
         # Build description
         config = item.get("configuration", "").replace("-", " ").title()
@@ -213,11 +231,14 @@ def run_pricing(job: dict) -> None:
             "unitPrice": round(unit_price, 2),
             "quantity": qty,
             "totalPrice": total_price,
-            "breakdown": breakdown,
+            "breakdown": None,
             "manualOverride": False,
             "overrideReason": None,
         }
         line_items.append(line_item)
+        priced_items.append(item)
+        priced_lines.append(line_item)
+        priced_unit_prices.append(unit_price)
         subtotal += total_price
 
         logger.info(
@@ -232,6 +253,11 @@ def run_pricing(job: dict) -> None:
             rule_used=applied_rule["name"] if applied_rule else "default",
         )
 
+    for line_item, breakdown in zip(
+        priced_lines, _compute_breakdown_batch(priced_items, priced_unit_prices),
+    ):
+        line_item["breakdown"] = breakdown
+
     # Compute totals
     tax_rate = 0.0  # Tax can be configured later
     tax = round(subtotal * tax_rate, 2)
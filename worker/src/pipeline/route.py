@@ -12,7 +12,7 @@ from ..db import update_job_status, get_cursor
 logger = structlog.get_logger()
 
 # Classifications that are always relevant
-RELEVANT_CLASSIFICATIONS = {"SCHEDULE", "DETAIL", "NOTES", "ELEVATION"}
+RELEVANT_CLASSIFICATIONS = frozenset({"SCHEDULE", "DETAIL", "NOTES", "ELEVATION"})
 
 
 def run_routing(job: dict) -> None:
@@ -43,29 +43,30 @@ def run_routing(job: dict) -> None:
     # Determine relevant pages
     relevant_pages = []
     for page in page_index:
+        classification = page.get("classification")
+        relevant_to = page.get("relevantTo")
         is_relevant = False
         reason = []
 
         # Relevant if classification suggests content
-        if page.get("classification") in RELEVANT_CLASSIFICATIONS:
+        if classification in RELEVANT_CLASSIFICATIONS:
             is_relevant = True
-            reason.append(f"classification={page['classification']}")
+            reason.append(f"classification={classification}")
 
         # Relevant if keywords detected
-        if page.get("relevantTo") and len(page["relevantTo"]) > 0:
+        if relevant_to:
             is_relevant = True
-            reason.append(f"keywords={page['relevantTo']}")
+            reason.append(f"keywords={relevant_to}")
 
-        # Floor plans may have shower/mirror layouts
-        if page.get("classification") == "FLOOR_PLAN" and page.get("relevantTo"):
-            is_relevant = True
-            reason.append("floor_plan_with_keywords")
+            # Floor plans may have shower/mirror layouts
+            if classification == "FLOOR_PLAN":
+                reason.append("floor_plan_with_keywords")
 
         logger.info(
             "ROUTE_DECISION",
             job_id=job_id,
             page=page["pageNum"] + 1,
-            classification=page.get("classification"),
+            classification=classification,
             relevant_to=page.get("relevantTo", []),
             is_relevant=is_relevant,
             reason=", ".join(reason) if reason else "none",